@@ -10,23 +10,56 @@ from microbootstrap.bootstrappers.litestar import LitestarBootstrapper
 from microbootstrap.config.litestar import LitestarConfig
 
 from app.core.auth import jwt_auth
+from app.core.crypt import shutdown_crypt_pool
 from app.core.database import alchemy
 from app.core.di import container
+from app.core.events import event_bus
 from app.core.exceptions import (
     not_found_exception_handler,
     repository_exception_handler,
 )
 from app.core.settings import settings
+from app.domains.dictionaries.engine import dictionaries
+from app.domains.games.batching import guess_batcher
+from app.domains.games.broadcast import game_broadcaster
+from app.domains.games.engine import game_engine
 from app.domains.games.routers import GamesController, RoomGamesController
+from app.domains.games.scheduler import round_scheduler
+from app.domains.games.services import apply_guess_batch, encode_game
+from app.domains.leaderboard.engine import leaderboard_engine
 from app.domains.leaderboard.routers import LeaderboardController
 from app.domains.rooms.routers import CategoriesController, RoomsController
+from app.domains.rooms.search import room_name_index
 from app.domains.users.routers import UsersController
 
 bootstrapper = LitestarBootstrapper(settings)
 
 
+async def _on_startup(app: litestar.Litestar) -> None:
+    dictionaries.compile_stale()
+    dictionaries.load()
+    await event_bus.start()
+    await leaderboard_engine.load_from_db()
+    if room_name_index is not None:
+        await room_name_index.load_from_db()
+    game_broadcaster.start(encode_game)
+    guess_batcher.start(apply_guess_batch)
+    if game_engine is not None:
+        game_engine.start()
+    if settings.game_scheduler_enabled:
+        round_scheduler.start()
+
+
 async def _on_shutdown(app: litestar.Litestar) -> None:
+    await round_scheduler.stop()
+    await guess_batcher.stop()
+    if game_engine is not None:
+        await game_engine.stop()
+    await game_broadcaster.stop()
+    await event_bus.stop()
     await container.close()
+    shutdown_crypt_pool()
+    dictionaries.close()
 
 
 routes = [
@@ -58,6 +91,7 @@ bootstrapper.configure_application(
             NotFoundException: not_found_exception_handler,
         },
         on_app_init=[jwt_auth.on_app_init],
+        on_startup=[_on_startup],
         on_shutdown=[_on_shutdown],
     )
 )
@@ -5,11 +5,16 @@ from litestar.security.jwt import JWTAuth, Token
 
 from app.core.database import sqlalchemy_config
 from app.core.settings import settings
+from app.domains.users.cache import user_cache
 from app.domains.users.schemas import User
 from app.domains.users.services import UserService
 
 
 async def retrieve_user_handler(token: Token, connection: ASGIConnection[Any, Any, Any, Any]) -> User | None:
+    cached = user_cache.get(token.sub)
+    if cached is not None:
+        return cached
+
     db_session = sqlalchemy_config.provide_session(state=connection.app.state, scope=connection.scope)
     user_service = UserService(session=db_session)
 
@@ -22,7 +27,9 @@ async def retrieve_user_handler(token: Token, connection: ASGIConnection[Any, An
     if not user_model or user_model.is_banned:
         return None
 
-    return user_service.to_schema(user_model, schema_type=User)
+    user = user_service.to_schema(user_model, schema_type=User)
+    user_cache.set(token.sub, user)
+    return user
 
 
 EXCLUDED_PATHS = [
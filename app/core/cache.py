@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+from prometheus_client import Counter, Gauge
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+CACHE_HITS = Counter('cache_hits_total', 'In-process cache hits', ['cache'])
+CACHE_MISSES = Counter('cache_misses_total', 'In-process cache misses', ['cache'])
+CACHE_EVICTIONS = Counter('cache_evictions_total', 'In-process cache evictions', ['cache', 'reason'])
+CACHE_SIZE = Gauge('cache_size', 'In-process cache entries', ['cache'])
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache with per-entry expiry, local to the worker process."""
+
+    def __init__(self, name: str, maxsize: int, ttl: float) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._hits = CACHE_HITS.labels(cache=name)
+        self._misses = CACHE_MISSES.labels(cache=name)
+        self._expired = CACHE_EVICTIONS.labels(cache=name, reason='expired')
+        self._evicted = CACHE_EVICTIONS.labels(cache=name, reason='capacity')
+        self._invalidated = CACHE_EVICTIONS.labels(cache=name, reason='invalidated')
+        self._size = CACHE_SIZE.labels(cache=name)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses.inc()
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._expired.inc()
+            self._misses.inc()
+            self._size.set(len(self._data))
+            return None
+
+        self._data.move_to_end(key)
+        self._hits.inc()
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self._evicted.inc()
+        self._size.set(len(self._data))
+
+    def invalidate(self, key: K) -> None:
+        if self._data.pop(key, None) is not None:
+            self._invalidated.inc()
+            self._size.set(len(self._data))
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._size.set(0)
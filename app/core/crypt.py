@@ -1,19 +1,87 @@
 import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
 
+from litestar.exceptions import ServiceUnavailableException
 from passlib.context import CryptContext
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.settings import settings
+
+ERR_CRYPT_BUSY = 'Too many concurrent password operations, retry later'
 
 password_crypt_context = CryptContext(schemes=['argon2'], deprecated='auto')
 
+CRYPT_QUEUE_WAIT = Histogram('crypt_queue_wait_seconds', 'Time a password job waited for a crypt worker', ['op'])
+CRYPT_DURATION = Histogram('crypt_duration_seconds', 'Time spent hashing or verifying a password', ['op'])
+CRYPT_IN_FLIGHT = Gauge('crypt_in_flight', 'Password jobs queued or running in the crypt pool')
+CRYPT_REJECTED = Counter('crypt_rejected_total', 'Password jobs rejected because the crypt queue was full', ['op'])
+
+_executor: Executor | None = None
+_in_flight = 0
+
+
+def _timed(fn: Callable[..., Any], *args: Any) -> tuple[float, float, Any]:
+    started_at = time.monotonic()
+    result = fn(*args)
+    return started_at, time.monotonic(), result
+
+
+def _hash(password: str | bytes) -> str:
+    return password_crypt_context.hash(password)
+
+
+def _verify(plain_password: str | bytes, hashed_password: str) -> bool:
+    valid, _ = password_crypt_context.verify_and_update(plain_password, hashed_password)
+    return bool(valid)
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if settings.crypt_pool_kind == 'process':
+            _executor = ProcessPoolExecutor(max_workers=settings.crypt_pool_workers)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=settings.crypt_pool_workers, thread_name_prefix='crypt')
+    return _executor
+
+
+async def _submit(op: str, fn: Callable[..., Any], *args: Any) -> Any:
+    global _in_flight
+    if _in_flight >= settings.crypt_pool_workers + settings.crypt_max_queue:
+        CRYPT_REJECTED.labels(op=op).inc()
+        raise ServiceUnavailableException(
+            detail=ERR_CRYPT_BUSY,
+            headers={'Retry-After': str(settings.crypt_retry_after)},
+        )
+
+    _in_flight += 1
+    CRYPT_IN_FLIGHT.set(_in_flight)
+    submitted_at = time.monotonic()
+    try:
+        started_at, finished_at, result = await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), _timed, fn, *args
+        )
+    finally:
+        _in_flight -= 1
+        CRYPT_IN_FLIGHT.set(_in_flight)
+
+    CRYPT_QUEUE_WAIT.labels(op=op).observe(max(started_at - submitted_at, 0.0))
+    CRYPT_DURATION.labels(op=op).observe(finished_at - started_at)
+    return result
+
 
 async def get_password_hash(password: str | bytes) -> str:
-    return await asyncio.get_running_loop().run_in_executor(None, password_crypt_context.hash, password)
+    return await _submit('hash', _hash, password)
 
 
 async def verify_password(plain_password: str | bytes, hashed_password: str) -> bool:
-    valid, _ = await asyncio.get_running_loop().run_in_executor(
-        None,
-        password_crypt_context.verify_and_update,
-        plain_password,
-        hashed_password,
-    )
-    return bool(valid)
+    return await _submit('verify', _verify, plain_password, hashed_password)
+
+
+def shutdown_crypt_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -1,9 +1,15 @@
+from typing import Any, Callable, Mapping, Sequence
+
 from litestar.plugins.sqlalchemy import (
     AlembicAsyncConfig,
     AsyncSessionConfig,
     SQLAlchemyAsyncConfig,
     SQLAlchemyPlugin,
 )
+from sqlalchemy import ColumnElement, Update, bindparam, column, event, func, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.types import TypeEngine
 
 from app.core.settings import settings
 
@@ -17,3 +23,60 @@ sqlalchemy_config = SQLAlchemyAsyncConfig(
     create_all=False,
 )
 alchemy = SQLAlchemyPlugin(config=sqlalchemy_config)
+
+_AFTER_COMMIT_KEY = 'after_commit_callbacks'
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the session's current transaction commits; it is dropped on rollback."""
+    session.sync_session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, 'after_commit')
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_commit(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+async def update_from_values(
+    session: AsyncSession,
+    columns: Mapping[str, TypeEngine[Any]],
+    rows: Sequence[tuple[Any, ...]],
+    statement: Callable[[Mapping[str, ColumnElement[Any]]], Update],
+) -> None:
+    """Runs one UPDATE that applies a different set of values to every row of ``rows``.
+
+    ``statement`` builds the UPDATE of a core ``Table`` (an ORM entity would turn the executemany into a bulk update by
+    primary key) from the per-row ``columns`` by name. On PostgreSQL the rows are sent as a single
+    ``UPDATE ... FROM (VALUES ...)``; SQLite cannot name the columns of a VALUES list, so there they go as one
+    executemany of the same statement.
+    """
+    if not rows:
+        return
+    if session.bind.dialect.name == 'postgresql':
+        batch = values(*(column(name, type_) for name, type_ in columns.items()), name='batch').data(list(rows))
+        await session.execute(
+            statement({name: batch.c[name] for name in columns}).execution_options(synchronize_session=False)
+        )
+        return
+    # Bind names must not collide with column names, or core would add them to the SET clause.
+    params = {name: bindparam(f'b_{name}', type_=type_) for name, type_ in columns.items()}
+    await session.execute(
+        statement(params).execution_options(synchronize_session=False),
+        [{f'b_{name}': value for name, value in zip(columns, row, strict=True)} for row in rows],
+    )
+
+
+def random_uuid(session: AsyncSession) -> ColumnElement[Any]:
+    """SQL expression giving every row its own random UUID, for ``INSERT ... SELECT`` into UUID-keyed tables.
+
+    On SQLite the value is 16 random bytes, which is how UUID columns are stored there.
+    """
+    if session.bind.dialect.name == 'postgresql':
+        return func.gen_random_uuid()
+    return func.randomblob(16)
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import sqlalchemy_config
 from app.core.settings import Settings, settings
 from app.domains.games.services import GameService
+from app.domains.leaderboard.engine import LeaderboardEngine, leaderboard_engine
 from app.domains.leaderboard.services import LeaderboardService
 from app.domains.rooms.services import RoomService
 from app.domains.users.services import UserService
@@ -18,6 +19,10 @@ class AppProvider(Provider):
     def get_settings(self) -> Settings:
         return settings
 
+    @provide
+    def get_leaderboard_engine(self) -> LeaderboardEngine:
+        return leaderboard_engine
+
 
 class RequestProvider(Provider):
     scope = Scope.REQUEST
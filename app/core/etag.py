@@ -0,0 +1,23 @@
+from hashlib import blake2b
+
+ETAG_HEADER = 'ETag'
+IF_NONE_MATCH_HEADER = 'If-None-Match'
+CACHE_CONTROL_HEADER = 'Cache-Control'
+
+
+def weak_etag(version: int) -> str:
+    """Weak validator for a versioned resource: equal versions are equivalent, not necessarily byte-identical."""
+    return f'W/"{version}"'
+
+
+def content_etag(body: bytes) -> str:
+    """Strong validator derived from the encoded representation itself."""
+    return f'"{blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header value."""
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag.removeprefix('W/')
+    return any(candidate.strip().removeprefix('W/') == opaque for candidate in if_none_match.split(','))
@@ -0,0 +1,179 @@
+import asyncio
+from functools import partial
+from typing import Any, Callable, Protocol, TypeVar, Union
+from uuid import uuid4
+
+import asyncpg
+import msgspec
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import on_commit
+from app.core.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class Event(msgspec.Struct, frozen=True, tag=True):
+    """Base class for events fanned out to every worker."""
+
+
+E = TypeVar('E', bound=Event)
+Handler = Callable[[Any], None]
+
+
+class EventBackend(Protocol):
+    # Whether events reach the handlers of every worker, not only those of the publishing one.
+    fans_out: bool
+
+    async def start(self, deliver: Callable[[bytes], None]) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    def send(self, payload: bytes) -> None: ...
+
+
+class InMemoryEventBackend:
+    """Single-process backend: events only reach handlers of the publishing worker."""
+
+    fans_out = False
+
+    async def start(self, deliver: Callable[[bytes], None]) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    def send(self, payload: bytes) -> None:
+        return None
+
+
+class PostgresEventBackend:
+    """Fans events out to the other workers through Postgres LISTEN/NOTIFY on a dedicated connection."""
+
+    fans_out = True
+
+    def __init__(self, dsn: str, channel: str, reconnect_delay: float = 1.0) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._outbox: asyncio.Queue[bytes] = asyncio.Queue(maxsize=10_000)
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self, deliver: Callable[[bytes], None]) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(deliver), name='event-bus-postgres')
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def send(self, payload: bytes) -> None:
+        try:
+            self._outbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning('event bus outbox is full, dropping event')
+
+    async def _run(self, deliver: Callable[[bytes], None]) -> None:
+        while True:
+            try:
+                conn: asyncpg.Connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError):
+                logger.exception('event bus cannot connect to postgres')
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            closed = asyncio.Event()
+            conn.add_termination_listener(lambda _, closed=closed: closed.set())
+            try:
+                await conn.add_listener(self.channel, lambda _c, _pid, _ch, payload: deliver(payload.encode()))
+                await self._pump(conn, closed)
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                logger.exception('event bus lost its postgres connection')
+            finally:
+                if not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _pump(self, conn: asyncpg.Connection, closed: asyncio.Event) -> None:
+        closing = asyncio.ensure_future(closed.wait())
+        try:
+            while True:
+                getter = asyncio.ensure_future(self._outbox.get())
+                await asyncio.wait((getter, closing), return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    return
+                await self._flush(conn, getter.result())
+        finally:
+            closing.cancel()
+
+    async def _flush(self, conn: asyncpg.Connection, payload: bytes) -> None:
+        batch = [payload.decode()]
+        while not self._outbox.empty():
+            batch.append(self._outbox.get_nowait().decode())
+        await conn.execute('SELECT pg_notify($1, p) FROM unnest($2::text[]) AS p', self.channel, batch)
+
+
+class EventBus:
+    def __init__(self, backend: EventBackend) -> None:
+        self.backend = backend
+        self.origin = uuid4().hex.encode()
+        self._handlers: dict[type[Event], list[Handler]] = {}
+        self._decoder: msgspec.json.Decoder[Any] | None = None
+
+    def subscribe(self, event_type: type[E], handler: Callable[[E], None]) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._decoder = None
+
+    def publish(self, event: Event) -> None:
+        self._dispatch(event)
+        self.backend.send(self.origin + b' ' + msgspec.json.encode(event))
+
+    def publish_on_commit(self, session: AsyncSession, event: Event) -> None:
+        on_commit(session, partial(self.publish, event))
+
+    async def start(self) -> None:
+        await self.backend.start(self._receive)
+
+    async def stop(self) -> None:
+        await self.backend.stop()
+
+    def _receive(self, payload: bytes) -> None:
+        origin, _, body = payload.partition(b' ')
+        if origin == self.origin or not self._handlers:
+            return
+        if self._decoder is None:
+            self._decoder = msgspec.json.Decoder(Union[tuple(self._handlers)])  # type: ignore[arg-type]
+        try:
+            event = self._decoder.decode(body)
+        except msgspec.DecodeError:
+            logger.warning('dropping undecodable event', payload=body[:200])
+            return
+        self._dispatch(event)
+
+    def _dispatch(self, event: Event) -> None:
+        for handler in self._handlers.get(type(event), ()):
+            try:
+                handler(event)
+            except Exception:
+                logger.exception('event handler failed', event=type(event).__name__)
+
+
+def _make_backend() -> EventBackend:
+    kind = settings.event_bus_backend
+    if kind == 'auto':
+        kind = 'postgres' if settings.database_url.startswith('postgresql') else 'memory'
+    if kind == 'postgres':
+        dsn = settings.database_url.replace('postgresql+asyncpg://', 'postgresql://', 1)
+        return PostgresEventBackend(dsn=dsn, channel=settings.event_bus_channel)
+    return InMemoryEventBackend()
+
+
+event_bus = EventBus(backend=_make_backend())
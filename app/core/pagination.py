@@ -0,0 +1,24 @@
+import base64
+import binascii
+from typing import ClassVar, Self
+
+import msgspec
+from litestar.exceptions import ValidationException
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+class Cursor(msgspec.Struct, array_like=True):
+    """Opaque keyset pagination cursor, passed around as url-safe base64 of its JSON array."""
+
+    invalid_detail: ClassVar[str] = 'Invalid cursor'
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(msgspec.json.encode(self)).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, raw: str) -> Self:
+        try:
+            return msgspec.json.decode(base64.urlsafe_b64decode(raw + '=' * (-len(raw) % 4)), type=cls)
+        except (binascii.Error, ValueError, msgspec.DecodeError) as exc:
+            raise ValidationException(detail=cls.invalid_detail) from exc
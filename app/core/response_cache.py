@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from functools import wraps
+from inspect import Parameter, signature
+from typing import Any, Callable, Hashable
+
+from litestar import Request, Response
+
+from app.core.cache import TTLCache
+from app.core.etag import CACHE_CONTROL_HEADER, ETAG_HEADER, IF_NONE_MATCH_HEADER, content_etag, etag_matches
+from app.core.singleflight import H, KeyFunction, SingleFlight
+
+
+@dataclass(slots=True, frozen=True)
+class _Cached:
+    body: bytes
+    headers: dict[str, str]
+    etag: str
+
+
+class ResponseCache:
+    """Keeps GET handler responses as encoded JSON, with an ETag and Cache-Control, in the worker process.
+
+    A cached entry is served without running the handler or encoding anything, and as a bodiless 304 when the client's
+    ``If-None-Match`` matches. Entries last ``ttl`` seconds or until invalidated, which is also how long browsers and
+    CDNs are told they may reuse the response. Concurrent misses for a key share one read, and a read that was running
+    when the cache was invalidated is served to its callers but not stored.
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 256, cache_control: str | None = None) -> None:
+        self.name = name
+        self.cache_control = cache_control or f'public, max-age={int(ttl)}'
+        self._entries: TTLCache[Hashable, _Cached] = TTLCache(name=name, maxsize=maxsize, ttl=ttl)
+        self._reads = SingleFlight(name)
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __call__(self, key: KeyFunction) -> Callable[[H], H]:
+        """Decorates a GET handler of any controller; ``key`` gets the handler's keyword arguments, ``None`` bypasses."""
+
+        def decorator(handler: H) -> H:
+            handler_signature = signature(handler)
+            takes_request = 'request' in handler_signature.parameters
+
+            @wraps(handler)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                request: Request[Any, Any, Any] = kwargs['request'] if takes_request else kwargs.pop('request')
+                cache_key = await key(**kwargs)
+                if cache_key is None:
+                    return await handler(*args, **kwargs)
+
+                cached = self._entries.get(cache_key)
+                if cached is None:
+                    generation = self._generation
+                    landed = await self._reads.do((generation, cache_key), lambda: handler(*args, **kwargs))
+                    if landed.status_code != 200:
+                        return Response(landed.body, status_code=landed.status_code, headers=landed.headers)
+                    cached = self._store(cache_key, generation, landed.body, landed.headers)
+
+                if_none_match = request.headers.get(IF_NONE_MATCH_HEADER)
+                if if_none_match is not None and etag_matches(if_none_match, cached.etag):
+                    return Response(None, status_code=304, headers=cached.headers)
+                return Response(cached.body, headers=cached.headers)
+
+            if not takes_request:
+                # Litestar only passes the request to handlers that ask for it; If-None-Match needs it.
+                request_parameter = Parameter('request', Parameter.KEYWORD_ONLY, annotation=Request)
+                wrapper.__signature__ = handler_signature.replace(  # type: ignore[attr-defined]
+                    parameters=[*handler_signature.parameters.values(), request_parameter]
+                )
+                wrapper.__annotations__ = {**handler.__annotations__, 'request': Request}
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drops the entry for ``key``, or every entry; reads already running are not stored."""
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.invalidate(key)
+
+    def _store(self, key: Hashable, generation: int, body: bytes, headers: dict[str, str]) -> _Cached:
+        etag = content_etag(body)
+        cached = _Cached(
+            body=body,
+            headers={**headers, ETAG_HEADER: etag, CACHE_CONTROL_HEADER: self.cache_control},
+            etag=etag,
+        )
+        if generation == self._generation:
+            self._entries.set(key, cached)
+        return cached
@@ -16,6 +16,8 @@ class Settings(LitestarSettings):
     service_version: str = os.getenv('SERVICE_VERSION', '0.0.1')
     service_static_path: str = os.getenv('SERVICE_STATIC_PATH', '/static')
     app_url: str = os.getenv('APP_URL', 'http://localhost:8000')
+    # Worker processes started by ``litestar run``, read from the same variables it uses.
+    web_concurrency: int = int(os.getenv('LITESTAR_WEB_CONCURRENCY', os.getenv('WEB_CONCURRENCY', '1')))
 
     swagger_path: str = os.getenv('SWAGGER_PATH', '/docs')
     swagger_offline_docs: bool = os.getenv('SWAGGER_OFFLINE_DOCS', 'false').lower() in {
@@ -49,5 +51,39 @@ class Settings(LitestarSettings):
     jwt_secret: str = os.getenv('JWT_SECRET', 'change-me')
     database_url: str = os.getenv('DATABASE_URL', 'postgresql+asyncpg://app:app@db:5432/app')
 
+    event_bus_backend: str = os.getenv('EVENT_BUS_BACKEND', 'auto')  # auto | postgres | memory
+    event_bus_channel: str = os.getenv('EVENT_BUS_CHANNEL', 'wordcon_events')
+
+    auth_user_cache_size: int = int(os.getenv('AUTH_USER_CACHE_SIZE', '10000'))
+    auth_user_cache_ttl: float = float(os.getenv('AUTH_USER_CACHE_TTL', '30'))
+
+    crypt_pool_kind: str = os.getenv('CRYPT_POOL_KIND', 'thread')  # thread | process
+    crypt_pool_workers: int = int(os.getenv('CRYPT_POOL_WORKERS', '2'))
+    crypt_max_queue: int = int(os.getenv('CRYPT_MAX_QUEUE', '32'))
+    crypt_retry_after: int = int(os.getenv('CRYPT_RETRY_AFTER', '1'))
+
+    game_scheduler_enabled: bool = os.getenv('GAME_SCHEDULER_ENABLED', 'true').lower() in {'1', 'true', 'yes', 'on'}
+    game_scheduler_resync_interval: float = float(os.getenv('GAME_SCHEDULER_RESYNC_INTERVAL', '5'))
+    game_scheduler_batch_size: int = int(os.getenv('GAME_SCHEDULER_BATCH_SIZE', '500'))
+    game_max_rounds: int = int(os.getenv('GAME_MAX_ROUNDS', '10'))
+    game_stream_ping_interval: float = float(os.getenv('GAME_STREAM_PING_INTERVAL', '15'))
+    game_history_depth: int = int(os.getenv('GAME_HISTORY_DEPTH', '64'))
+    game_history_max_games: int = int(os.getenv('GAME_HISTORY_MAX_GAMES', '10000'))
+    game_standings_cache_size: int = int(os.getenv('GAME_STANDINGS_CACHE_SIZE', '10000'))
+    game_standings_cache_ttl: float = float(os.getenv('GAME_STANDINGS_CACHE_TTL', '60'))
+    game_engine_enabled: bool = os.getenv('GAME_ENGINE_ENABLED', 'false').lower() in {'1', 'true', 'yes', 'on'}
+    game_engine_flush_interval: float = float(os.getenv('GAME_ENGINE_FLUSH_INTERVAL', '0.05'))
+    guess_batch_window: float = float(os.getenv('GUESS_BATCH_WINDOW', '0.005'))
+    guess_batch_max_size: int = int(os.getenv('GUESS_BATCH_MAX_SIZE', '256'))
+
+    room_search_max_candidates: int = int(os.getenv('ROOM_SEARCH_MAX_CANDIDATES', '5000'))
+
+    dictionaries_dir: str = os.getenv('DICTIONARIES_DIR', 'dictionaries')
+    guess_max_edit_distance: int = int(os.getenv('GUESS_MAX_EDIT_DISTANCE', '1'))
+    guess_typo_min_length: int = int(os.getenv('GUESS_TYPO_MIN_LENGTH', '5'))
+
+    categories_cache_ttl: float = float(os.getenv('CATEGORIES_CACHE_TTL', '3600'))
+    leaderboard_cache_ttl: float = float(os.getenv('LEADERBOARD_CACHE_TTL', '5'))
+
 
 settings = Settings()
@@ -0,0 +1,109 @@
+import asyncio
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+import msgspec
+from litestar import Response
+from prometheus_client import Counter
+
+SINGLE_FLIGHT_READS = Counter(
+    'single_flight_reads_total',
+    'Reads through single-flight groups, by whether they ran the read or joined one in flight',
+    ['group', 'role'],
+)
+
+H = TypeVar('H', bound=Callable[..., Awaitable[Any]])
+
+# Builds the flight key from a handler's keyword arguments; ``None`` runs the handler on its own.
+KeyFunction = Callable[..., Awaitable[Hashable | None]]
+
+
+@dataclass(slots=True, frozen=True)
+class _Landed:
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class SingleFlight:
+    """Coalesces concurrent identical reads into one computation whose response is encoded once.
+
+    The first caller for a key runs the read; callers arriving with the same key while it is in flight wait for it and
+    get the same encoded bytes (or the same exception). Nothing is kept once the flight lands, so a caller never gets a
+    response older than the read that was running when it arrived; keys that include the resource version, or a
+    ``forget`` when the resource changes, make later arrivals start a new read. If the caller running the read is
+    cancelled, the next waiter takes over.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._flights: dict[Hashable, asyncio.Future[_Landed]] = {}
+        self._leaders = SINGLE_FLIGHT_READS.labels(group=name, role='leader')
+        self._followers = SINGLE_FLIGHT_READS.labels(group=name, role='follower')
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __call__(self, key: KeyFunction) -> Callable[[H], H]:
+        """Decorates a GET handler; its result is sent as pre-encoded JSON shared by every caller of the flight."""
+
+        def decorator(handler: H) -> H:
+            @wraps(handler)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                flight_key = await key(**kwargs)
+                if flight_key is None:
+                    return await handler(*args, **kwargs)
+                landed = await self.do(flight_key, lambda: handler(*args, **kwargs))
+                return Response(landed.body, status_code=landed.status_code, headers=landed.headers)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def forget(self, key: Hashable) -> None:
+        """Makes callers arriving from now on start a new read for ``key``; the current one still lands for its waiters."""
+        self._flights.pop(key, None)
+
+    def forget_resource(self, resource: Hashable) -> None:
+        """``forget`` for every key of the form ``(resource, ...)``, whatever the rest of the key holds."""
+        for key in [key for key in self._flights if isinstance(key, tuple) and key and key[0] == resource]:
+            del self._flights[key]
+
+    async def do(self, key: Hashable, read: Callable[[], Awaitable[Any]]) -> _Landed:
+        while (flight := self._flights.get(key)) is not None:
+            self._followers.inc()
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+
+        flight = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting when a read fails; retrieve the exception so it is not reported as lost.
+        flight.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._flights[key] = flight
+        self._leaders.inc()
+        try:
+            landed = self._encode(await read())
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(landed)
+            return landed
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    @staticmethod
+    def _encode(result: Any) -> _Landed:
+        if isinstance(result, Response):
+            content = result.content
+            body = b'' if content is None else msgspec.json.encode(content)
+            # A response without a status gets the GET default from the route handler.
+            return _Landed(status_code=result.status_code or 200, headers=dict(result.headers), body=body)
+        return _Landed(status_code=200, headers={}, body=msgspec.json.encode(result))
@@ -0,0 +1,71 @@
+"""Benchmark guess matching against a synthetic category dictionary.
+
+Usage: python -m app.domains.dictionaries.bench [WORDS] [MAX_DISTANCE]
+"""
+
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from app.domains.dictionaries.engine import CategoryDictionary, compile_dictionary
+
+QUERIES = 10_000
+
+
+def _random_word(rng: random.Random) -> str:
+    return ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 12)))
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    pos = rng.randrange(len(word))
+    match rng.choice('dis'):
+        case 'd':
+            return word[:pos] + word[pos + 1 :]
+        case 'i':
+            return word[:pos] + rng.choice(string.ascii_lowercase) + word[pos:]
+        case _:
+            return word[:pos] + rng.choice(string.ascii_lowercase) + word[pos + 1 :]
+
+
+def _per_call_us(fn: Callable[[str], object], queries: list[str]) -> float:
+    started = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - started) / len(queries) * 1e6
+
+
+def main(argv: list[str]) -> None:
+    size = int(argv[0]) if argv else 100_000
+    max_distance = int(argv[1]) if len(argv) > 1 else 1
+    rng = random.Random(42)
+
+    words: set[str] = set()
+    while len(words) < size:
+        words.add(_random_word(rng))
+    sample = rng.sample(sorted(words), QUERIES)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'bench.wcd'
+        started = time.perf_counter()
+        compile_dictionary('Bench', words, path, max_distance=max_distance)
+        print(
+            f'compiled {size} words, distance {max_distance}: {time.perf_counter() - started:.1f} s, '
+            f'{path.stat().st_size / 2**20:.1f} MiB'
+        )
+
+        dictionary = CategoryDictionary(path)
+        typos = [_typo(rng, word) for word in sample]
+        misses = [_random_word(rng) + 'zz' for _ in range(QUERIES)]
+        for label, queries in (('exact', sample), ('typo', typos), ('miss', misses)):
+            us = _per_call_us(lambda query: dictionary.match(query, max_distance), queries)
+            hits = sum(dictionary.match(query, max_distance) is not None for query in queries)
+            print(f'{label:>5}: {us:6.1f} us/guess, {hits / len(queries):.0%} matched')
+        dictionary.close()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,22 @@
+"""Compile category word lists into memory-mappable dictionaries.
+
+Usage: python -m app.domains.dictionaries.compile [SOURCES_DIR] [OUTPUT_DIR]
+"""
+
+import sys
+from pathlib import Path
+
+from app.core.settings import settings
+from app.domains.dictionaries.engine import SOURCES_DIR, compile_sources
+
+
+def main(argv: list[str]) -> None:
+    sources = Path(argv[0]) if argv else SOURCES_DIR
+    output = Path(argv[1]) if len(argv) > 1 else Path(settings.dictionaries_dir)
+    compiled = compile_sources(sources, output, max_distance=settings.guess_max_edit_distance, force=True)
+    for category, count in compiled.items():
+        print(f'{category}: {count} words')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
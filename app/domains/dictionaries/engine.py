@@ -0,0 +1,342 @@
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import structlog
+
+from app.core.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+MAGIC = b'WCDICT\x00\x02'
+SUFFIX = '.wcd'
+SOURCES_DIR = Path(__file__).parent / 'sources'
+
+# magic, word count, word slot count, category name length, word data length, max edit distance,
+# deletion key count, deletion slot count, deletion key data length, postings length
+_HEADER = struct.Struct('<8sIIIIIIIII')
+
+
+def normalize_word(word: str) -> str:
+    return ' '.join(word.split()).casefold().replace('ё', 'е')
+
+
+def deletions(word: str, distance: int) -> set[str]:
+    """Distinct strings obtained by deleting 1 to ``distance`` characters from ``word``."""
+    result: set[str] = set()
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))} - result
+        result |= frontier
+    return result
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance between ``a`` and ``b``, or ``limit + 1`` as soon as it is known to exceed ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def _slot_count(count: int) -> int:
+    slots = 8
+    while slots < count * 2:
+        slots <<= 1
+    return slots
+
+
+def _string_table(keys: list[bytes]) -> tuple[array[int], bytes]:
+    data = bytearray()
+    offsets = array('I', [0])
+    for key in keys:
+        data += key
+        offsets.append(len(data))
+    return offsets, bytes(data)
+
+
+def _hash_table(keys: list[bytes]) -> array[int]:
+    slots = _slot_count(len(keys))
+    mask = slots - 1
+    table = array('I', bytes(4 * slots))
+    for ordinal, key in enumerate(keys):
+        slot = zlib.crc32(key) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = ordinal + 1
+    return table
+
+
+def compile_dictionary(name: str, words: Iterable[str], path: Path, max_distance: int = 0) -> int:
+    """Writes ``words`` as a compiled dictionary and returns the number of distinct words.
+
+    After the header and the 4-byte padded category name come the little-endian u32 sections (word offsets, word hash
+    slots, deletion key offsets, posting offsets, deletion hash slots, postings) and then the word and deletion key
+    data. Words are sorted by their UTF-8 bytes and a word's ordinal is its position in that order. Hash slots hold
+    ``ordinal + 1`` keyed by crc32 with linear probing, 0 marks an empty slot. The deletion index maps every string
+    obtained by deleting up to ``max_distance`` characters from a word to the ordinals of those words.
+    """
+    keys = sorted({key.encode() for key in map(normalize_word, words) if key})
+    offsets, data = _string_table(keys)
+    slots = _hash_table(keys)
+
+    postings_by_key: defaultdict[bytes, list[int]] = defaultdict(list)
+    for ordinal, key in enumerate(keys):
+        for deleted in deletions(key.decode(), max_distance):
+            postings_by_key[deleted.encode()].append(ordinal)
+    deletion_keys = sorted(postings_by_key)
+    deletion_offsets, deletion_data = _string_table(deletion_keys)
+    deletion_slots = _hash_table(deletion_keys)
+    posting_offsets = array('I', [0])
+    postings = array('I')
+    for key in deletion_keys:
+        postings.extend(postings_by_key[key])
+        posting_offsets.append(len(postings))
+
+    sections = (offsets, slots, deletion_offsets, posting_offsets, deletion_slots, postings)
+    if sys.byteorder != 'little':
+        for section in sections:
+            section.byteswap()
+
+    name_bytes = name.encode()
+    header = _HEADER.pack(
+        MAGIC,
+        len(keys),
+        len(slots),
+        len(name_bytes),
+        len(data),
+        max_distance,
+        len(deletion_keys),
+        len(deletion_slots),
+        len(deletion_data),
+        len(postings),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    with tmp_path.open('wb') as f:
+        f.write(header)
+        f.write(name_bytes + bytes(-len(name_bytes) % 4))
+        for section in sections:
+            f.write(section.tobytes())
+        f.write(data)
+        f.write(deletion_data)
+    os.replace(tmp_path, path)
+    return len(keys)
+
+
+def _is_current(source: Path, target: Path, max_distance: int) -> bool:
+    if not target.exists() or target.stat().st_mtime < source.stat().st_mtime:
+        return False
+    with target.open('rb') as f:
+        header = f.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        return False
+    magic, *_, compiled_distance, _, _, _, _ = _HEADER.unpack(header)
+    return magic == MAGIC and compiled_distance == max_distance
+
+
+def compile_sources(sources: Path, directory: Path, max_distance: int, force: bool = False) -> dict[str, int]:
+    """Compiles every ``*.txt`` word list in ``sources`` (one word per line, named after its category)."""
+    compiled: dict[str, int] = {}
+    for source in sorted(sources.glob('*.txt')):
+        target = directory / (source.stem + SUFFIX)
+        if not force and _is_current(source, target, max_distance):
+            continue
+        with source.open(encoding='utf-8') as f:
+            compiled[source.stem] = compile_dictionary(
+                source.stem.replace('_', ' ').title(), f, target, max_distance=max_distance
+            )
+        logger.info('compiled category dictionary', category=source.stem, words=compiled[source.stem])
+    return compiled
+
+
+class _MappedTable:
+    """Hashed string table laid out by ``compile_dictionary``: offsets into ``data`` plus crc32 slots."""
+
+    __slots__ = ('offsets', 'slots', 'data', 'mask')
+
+    def __init__(self, offsets: memoryview, slots: memoryview, data: memoryview) -> None:
+        self.offsets = offsets
+        self.slots = slots
+        self.data = data
+        self.mask = len(slots) - 1
+
+    def find(self, key: bytes) -> int | None:
+        slot = zlib.crc32(key) & self.mask
+        while entry := self.slots[slot]:
+            ordinal = entry - 1
+            start = self.offsets[ordinal]
+            end = self.offsets[ordinal + 1]
+            if end - start == len(key) and self.data[start:end] == key:
+                return ordinal
+            slot = (slot + 1) & self.mask
+        return None
+
+    def get(self, ordinal: int) -> bytes:
+        return bytes(self.data[self.offsets[ordinal] : self.offsets[ordinal + 1]])
+
+    def release(self) -> None:
+        for view in (self.offsets, self.slots, self.data):
+            view.release()
+
+
+class CategoryDictionary:
+    """Read-only view of a compiled dictionary mapped straight from disk.
+
+    The file is mapped shared and read-only, so every worker process reads the same page-cache pages and opening it
+    costs nothing up front. Exact membership is a crc32 of the normalized word plus an expected O(1) probe that
+    compares against the mapped bytes in place. Typo-tolerant matching uses the symmetric-delete index: the query and
+    its deletions are probed against the words and their deletions, and only the few words found that way are checked
+    with a bounded edit distance.
+    """
+
+    def __init__(self, path: Path) -> None:
+        if sys.byteorder != 'little':
+            raise RuntimeError('Compiled dictionaries can only be mapped on little-endian hosts')
+
+        self.path = path
+        with path.open('rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            count,
+            slots,
+            name_len,
+            data_len,
+            max_distance,
+            deletion_count,
+            deletion_slots,
+            deletion_data_len,
+            postings_len,
+        ) = _HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f'{path} is not a compiled dictionary')
+
+        self._view = memoryview(self._mm)
+        self._pos = _HEADER.size
+        self.name = bytes(self._take(name_len + (-name_len % 4))[:name_len]).decode()
+        offsets = self._take_u32(count + 1)
+        word_slots = self._take_u32(slots)
+        deletion_offsets = self._take_u32(deletion_count + 1)
+        self._posting_offsets = self._take_u32(deletion_count + 1)
+        deletion_slot_table = self._take_u32(deletion_slots)
+        self._postings = self._take_u32(postings_len)
+        self._words = _MappedTable(offsets, word_slots, self._take(data_len))
+        self._deletions = _MappedTable(deletion_offsets, deletion_slot_table, self._take(deletion_data_len))
+        self.max_distance = max_distance
+        # Identifies the ordinal to word mapping, which a recompile with a different word list changes.
+        self.fingerprint = zlib.crc32(self._words.data, zlib.crc32(offsets))
+        self._count = count
+
+    def _take(self, size: int) -> memoryview:
+        view = self._view[self._pos : self._pos + size]
+        self._pos += size
+        return view
+
+    def _take_u32(self, count: int) -> memoryview:
+        return self._take(4 * count).cast('I')
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.index(word) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for ordinal in range(self._count):
+            yield self.word(ordinal)
+
+    def index(self, word: str) -> int | None:
+        """Ordinal of ``word`` in the sorted table, or ``None`` if it is not in the dictionary."""
+        return self._words.find(normalize_word(word).encode())
+
+    def match(self, word: str, max_distance: int) -> int | None:
+        """Ordinal of ``word`` or of the closest word within ``max_distance`` edits, ``None`` if there is none.
+
+        ``max_distance`` is capped by the distance the dictionary was compiled for. Ties go to the lowest ordinal.
+        """
+        key = normalize_word(word)
+        exact = self._words.find(key.encode())
+        max_distance = min(max_distance, self.max_distance)
+        if exact is not None or max_distance <= 0 or not key:
+            return exact
+
+        candidates: set[int] = set()
+        for probe in (key, *deletions(key, max_distance)):
+            probe_bytes = probe.encode()
+            if probe is not key and (ordinal := self._words.find(probe_bytes)) is not None:
+                candidates.add(ordinal)
+            if (entry := self._deletions.find(probe_bytes)) is not None:
+                candidates.update(self._postings[self._posting_offsets[entry] : self._posting_offsets[entry + 1]])
+
+        best: tuple[int, int] | None = None
+        for ordinal in candidates:
+            distance = edit_distance(key, self.word(ordinal), max_distance)
+            if distance <= max_distance and (best is None or (distance, ordinal) < best):
+                best = (distance, ordinal)
+        return best[1] if best is not None else None
+
+    def word(self, ordinal: int) -> str:
+        return self._words.get(ordinal).decode()
+
+    def close(self) -> None:
+        self._words.release()
+        self._deletions.release()
+        for view in (self._posting_offsets, self._postings, self._view):
+            view.release()
+        self._mm.close()
+
+
+class DictionaryRegistry:
+    """Compiled category dictionaries found in ``directory``, keyed by case-insensitive category name."""
+
+    def __init__(self, directory: Path, sources: Path, max_distance: int) -> None:
+        self.directory = directory
+        self.sources = sources
+        self.max_distance = max_distance
+        self._dictionaries: dict[str, CategoryDictionary] = {}
+
+    def __len__(self) -> int:
+        return len(self._dictionaries)
+
+    def names(self) -> list[str]:
+        return sorted(d.name for d in self._dictionaries.values())
+
+    def get(self, category: str) -> CategoryDictionary | None:
+        return self._dictionaries.get(category.casefold())
+
+    def compile_stale(self) -> dict[str, int]:
+        """Compiles source word lists that have no up-to-date compiled file for the configured edit distance."""
+        return compile_sources(self.sources, self.directory, max_distance=self.max_distance)
+
+    def load(self) -> None:
+        self.close()
+        for path in sorted(self.directory.glob('*' + SUFFIX)):
+            dictionary = CategoryDictionary(path)
+            self._dictionaries[dictionary.name.casefold()] = dictionary
+
+    def close(self) -> None:
+        for dictionary in self._dictionaries.values():
+            dictionary.close()
+        self._dictionaries.clear()
+
+
+dictionaries = DictionaryRegistry(
+    directory=Path(settings.dictionaries_dir),
+    sources=SOURCES_DIR,
+    max_distance=settings.guess_max_edit_distance,
+)
@@ -0,0 +1,93 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from prometheus_client import Histogram
+
+from app.core.settings import settings
+
+GUESS_BATCH_SIZE = Histogram(
+    'game_guess_batch_size',
+    'Guesses applied in one group commit',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+)
+
+
+@dataclass(slots=True)
+class PendingGuess:
+    user_id: UUID
+    text: str
+
+
+# Applies a batch of guesses of one game and returns one outcome per guess, in order: either the result handed to the
+# caller or the exception raised in it.
+BatchApplier = Callable[[UUID, list[PendingGuess]], Awaitable[list[Any]]]
+
+
+class GuessBatcher:
+    """Group-commits concurrent guesses of the same game.
+
+    The first guess of a game opens a batch and waits ``window`` seconds for others to join it; the batch is then
+    applied in one transaction and every caller gets its own outcome. Guesses arriving while a batch is being applied
+    form the next one, which runs as soon as the current one commits, so under load batches grow with the commit
+    latency instead of the requests queueing on the same row locks.
+    """
+
+    def __init__(self, window: float, max_size: int) -> None:
+        self.window = window
+        self.max_size = max_size
+        self._pending: dict[UUID, list[tuple[PendingGuess, asyncio.Future[Any]]]] = {}
+        self._drainers: dict[UUID, asyncio.Task[None]] = {}
+        self._applier: BatchApplier | None = None
+
+    def start(self, applier: BatchApplier) -> None:
+        self._applier = applier
+
+    async def stop(self) -> None:
+        if self._drainers:
+            await asyncio.gather(*self._drainers.values(), return_exceptions=True)
+
+    async def submit(self, game_id: UUID, user_id: UUID, text: str) -> Any:
+        if self._applier is None:
+            raise RuntimeError('GuessBatcher is not started')
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(game_id, []).append((PendingGuess(user_id=user_id, text=text), future))
+        if game_id not in self._drainers:
+            self._drainers[game_id] = asyncio.create_task(self._drain(game_id), name='game-guess-batch')
+        return await future
+
+    async def _drain(self, game_id: UUID) -> None:
+        try:
+            if self.window > 0:
+                await asyncio.sleep(self.window)
+            while pending := self._pending.pop(game_id, None):
+                if len(pending) > self.max_size:
+                    self._pending[game_id] = pending[self.max_size :]
+                    pending = pending[: self.max_size]
+                await self._apply(game_id, pending)
+        finally:
+            self._drainers.pop(game_id, None)
+
+    async def _apply(self, game_id: UUID, batch: list[tuple[PendingGuess, asyncio.Future[Any]]]) -> None:
+        if self._applier is None:
+            raise RuntimeError('GuessBatcher is not started')
+        GUESS_BATCH_SIZE.observe(len(batch))
+        try:
+            outcomes = await self._applier(game_id, [guess for guess, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), outcome in zip(batch, outcomes, strict=True):
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+guess_batcher = GuessBatcher(window=settings.guess_batch_window, max_size=settings.guess_batch_max_size)
@@ -0,0 +1,139 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable
+from uuid import UUID
+
+import structlog
+
+from app.core.events import event_bus
+from app.domains.games.events import GameChanged
+
+logger = structlog.get_logger(__name__)
+
+SSE_PING = b': ping\n\n'
+
+
+@dataclass(slots=True)
+class EncodedGame:
+    version: int
+    full: bytes
+    # Changes since the version the loader was asked about, if they are still known.
+    delta: bytes | None = None
+
+
+# Loads and encodes a game, with its changes since the given version when one is passed.
+GameLoader = Callable[[UUID, int | None], Awaitable[EncodedGame]]
+
+
+@dataclass(slots=True, eq=False)
+class _Subscriber:
+    version: int
+    queue: asyncio.Queue[bytes] = field(default_factory=lambda: asyncio.Queue(maxsize=1))
+
+
+def sse_frame(payload: bytes, event: str = 'game') -> bytes:
+    return b'event: ' + event.encode() + b'\ndata: ' + payload + b'\n\n'
+
+
+class GameBroadcaster:
+    """Pushes encoded game state to stream subscribers of this worker.
+
+    ``notify`` only marks a game as changed; a single background task then loads and encodes the game once and hands
+    the same SSE frames to every subscriber: a ``delta`` frame with the changes since the previous broadcast to those
+    that received it, the full ``game`` frame to the rest. Each subscriber keeps at most one pending frame, so slow
+    readers skip intermediate states instead of buffering them, and get a full frame next.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[UUID, set[_Subscriber]] = {}
+        self._versions: dict[UUID, int] = {}
+        self._dirty: set[UUID] = set()
+        self._wakeup = asyncio.Event()
+        self._loader: GameLoader | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, loader: GameLoader) -> None:
+        self._loader = loader
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name='game-broadcaster')
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def notify(self, game_id: UUID) -> None:
+        if game_id in self._subscribers:
+            self._dirty.add(game_id)
+            self._wakeup.set()
+
+    async def snapshot(self, game_id: UUID, since: int | None = None) -> EncodedGame:
+        return await self._load(game_id, since)
+
+    async def subscribe(self, game_id: UUID, first: EncodedGame, ping_interval: float) -> AsyncIterator[bytes]:
+        subscriber = _Subscriber(version=first.version)
+        self._subscribers.setdefault(game_id, set()).add(subscriber)
+        self._versions.setdefault(game_id, first.version)
+        try:
+            yield sse_frame(first.delta, 'delta') if first.delta is not None else sse_frame(first.full)
+            while True:
+                try:
+                    yield await asyncio.wait_for(subscriber.queue.get(), timeout=ping_interval)
+                except TimeoutError:
+                    yield SSE_PING
+        finally:
+            subscribers = self._subscribers.get(game_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[game_id]
+                    self._versions.pop(game_id, None)
+
+    async def _load(self, game_id: UUID, since: int | None) -> EncodedGame:
+        if self._loader is None:
+            raise RuntimeError('GameBroadcaster is not started')
+        return await self._loader(game_id, since)
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            dirty, self._dirty = self._dirty, set()
+            for game_id in dirty:
+                if game_id not in self._subscribers:
+                    continue
+                try:
+                    encoded = await self._load(game_id, self._versions.get(game_id))
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception('failed to load game for broadcast', game_id=str(game_id))
+                    continue
+                self.publish(game_id, encoded)
+
+    def publish(self, game_id: UUID, encoded: EncodedGame) -> None:
+        subscribers = self._subscribers.get(game_id)
+        if not subscribers:
+            return
+        since = self._versions.get(game_id)
+        self._versions[game_id] = encoded.version
+        full = sse_frame(encoded.full)
+        delta = sse_frame(encoded.delta, 'delta') if encoded.delta is not None else None
+        for subscriber in subscribers:
+            caught_up = subscriber.version == since
+            if subscriber.queue.full():
+                # The dropped frame was the base of the delta, so this subscriber needs the whole game.
+                subscriber.queue.get_nowait()
+                caught_up = False
+            subscriber.queue.put_nowait(delta if delta is not None and caught_up else full)
+            subscriber.version = encoded.version
+
+
+game_broadcaster = GameBroadcaster()
+
+event_bus.subscribe(GameChanged, lambda event: game_broadcaster.notify(event.game_id))
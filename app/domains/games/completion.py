@@ -0,0 +1,118 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Hashable, Iterable, TypeVar, cast
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Integer, Table, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import update_from_values
+from app.core.events import event_bus
+from app.domains.games.events import GameChanged
+from app.domains.games.models import GameModel, GamePlayerModel, GameState
+from app.domains.games.standings import competition_places
+from app.domains.rooms.events import RoomChanged
+from app.domains.rooms.models import RoomModel, RoomStatus
+from app.domains.users.events import UserRankChanged
+from app.domains.users.models import UserModel
+
+K = TypeVar('K', bound=Hashable)
+
+_game_players_table = cast(Table, GamePlayerModel.__table__)
+_users_table = cast(Table, UserModel.__table__)
+_game_players = _game_players_table.c
+_users = _users_table.c
+
+
+def rank_places(scores: Iterable[tuple[K, int, datetime]]) -> list[tuple[K, int]]:
+    """Places for ``(key, points, joined_at)`` scores, best first; equal points share a place and skip the next ones."""
+    ranked = sorted(scores, key=lambda score: (-score[1], score[2]))
+    return list(zip((key for key, _, _ in ranked), competition_places(points for _, points, _ in ranked), strict=True))
+
+
+async def complete_games(session: AsyncSession, *criteria: ColumnElement[bool]) -> list[UUID]:
+    """Ends the games matching ``criteria`` in the session's transaction and returns the ids of those it ended.
+
+    Places are ranked once and written with one bulk UPDATE, game points are added to ``users.points`` with another,
+    and the rooms are marked finished. A game is ended at most once: only rows without an ``end_date`` are claimed, so
+    concurrent finishers of the same game leave all but one with nothing to do. Events go out after the commit.
+    """
+    now = datetime.now(timezone.utc)
+    ended = (
+        await session.execute(
+            update(GameModel)
+            .where(*criteria, GameModel.end_date.is_(None))
+            .values(state=GameState.ENDED.value, end_date=now, version=GameModel.version + 1, updated_at=now)
+            .returning(GameModel.id, GameModel.room_id)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+    if not ended:
+        return []
+    game_ids = [row.id for row in ended]
+
+    players = (
+        await session.execute(
+            select(
+                GamePlayerModel.id,
+                GamePlayerModel.game_id,
+                GamePlayerModel.user_id,
+                GamePlayerModel.points,
+                GamePlayerModel.created_at,
+            ).where(GamePlayerModel.game_id.in_(game_ids))
+        )
+    ).all()
+    by_game: defaultdict[UUID, list[Any]] = defaultdict(list)
+    totals: defaultdict[UUID, int] = defaultdict(int)
+    for player in players:
+        by_game[player.game_id].append((player.id, player.points, player.created_at))
+        if player.points:
+            totals[player.user_id] += player.points
+
+    await update_from_values(
+        session,
+        {'id': GamePlayerModel.id.type, 'place': Integer()},
+        [place for scores in by_game.values() for place in rank_places(scores)],
+        lambda batch: (
+            update(_game_players_table)
+            .where(_game_players.id == batch['id'])
+            .values(place=batch['place'], updated_at=now)
+        ),
+    )
+    await update_from_values(
+        session,
+        {'id': UserModel.id.type, 'delta': Integer()},
+        list(totals.items()),
+        lambda batch: (
+            update(_users_table)
+            .where(_users.id == batch['id'])
+            .values(points=_users.points + batch['delta'], updated_at=now)
+        ),
+    )
+    await session.execute(
+        update(RoomModel)
+        .where(RoomModel.id.in_({row.room_id for row in ended}))
+        .values(status=RoomStatus.FINISHED.value, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+
+    if totals:
+        users = await session.execute(
+            select(UserModel.id, UserModel.username, UserModel.points, UserModel.avatar_url).where(
+                UserModel.id.in_(totals)
+            )
+        )
+        for user in users:
+            event_bus.publish_on_commit(
+                session,
+                UserRankChanged(
+                    user_id=user.id,
+                    username=user.username,
+                    points=user.points,
+                    avatar_url=user.avatar_url,
+                ),
+            )
+    for row in ended:
+        event_bus.publish_on_commit(session, GameChanged(game_id=row.id))
+        event_bus.publish_on_commit(session, RoomChanged(room_id=row.room_id))
+    return game_ids
@@ -1,5 +1,9 @@
 ERR_GAME_NOT_FOUND = 'Game not found'
+ERR_ROOM_NOT_FOUND = 'Room not found'
 ERR_ONLY_OWNER_CAN_START = 'Only room owner can start the game'
+ERR_ONLY_OWNER_CAN_FINISH = 'Only room owner can finish the game'
 ERR_ROOM_NOT_OPEN = 'Room is not open for starting a game'
 ERR_NO_PLAYERS_IN_ROOM = 'No players in the room to start a game'
 ERR_NOT_IN_GAME = 'User is not a participant of this game'
+ERR_UNKNOWN_WORD = 'Word is not in the category dictionary'
+ERR_WORD_ALREADY_GUESSED = 'Word has already been guessed in this game'
@@ -0,0 +1,352 @@
+import asyncio
+from array import array
+from datetime import datetime, timezone
+from typing import Any, cast
+from uuid import UUID
+
+import structlog
+from sqlalchemy import Table, bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import sqlalchemy_config
+from app.core.events import event_bus
+from app.core.settings import settings
+from app.domains.games import guessed
+from app.domains.games.completion import complete_games
+from app.domains.games.events import GameChanged
+from app.domains.games.models import GameModel, GamePlayerModel, GameState
+from app.domains.games.scheduler import round_scheduler
+from app.domains.games.standings import Standings
+from app.domains.rooms.models import RoomModel
+
+logger = structlog.get_logger(__name__)
+
+# Core tables, so the flush statements run as executemany instead of ORM bulk updates by primary key.
+_games_table = cast(Table, GameModel.__table__)
+_game_players_table = cast(Table, GamePlayerModel.__table__)
+_games = _games_table.c
+_game_players = _game_players_table.c
+
+_FLUSH_HEAD = (
+    update(_games_table)
+    .where(_games.id == bindparam('b_id'))
+    .values(
+        state=bindparam('b_state'),
+        round=bindparam('b_round'),
+        last_tick_at=bindparam('b_last_tick_at'),
+        end_date=bindparam('b_end_date'),
+        # Relative, so version bumps made in SQL while the game is held here (a room rename) are kept.
+        version=_games.version + bindparam('b_version_delta'),
+        updated_at=bindparam('b_now'),
+    )
+)
+_FLUSH_POINTS = (
+    update(_game_players_table)
+    .where(_game_players.game_id == bindparam('b_game_id'), _game_players.user_id == bindparam('b_user_id'))
+    .values(points=_game_players.points + bindparam('b_delta'), updated_at=bindparam('b_now'))
+)
+_FLUSH_GUESSED = (
+    update(_games_table)
+    .where(_games.id == bindparam('b_id'))
+    .values(
+        guessed=bindparam('b_guessed'),
+        guessed_dictionary=bindparam('b_guessed_dictionary'),
+        updated_at=bindparam('b_now'),
+    )
+)
+
+
+class LiveGame:
+    """Running game held in memory. Per-player state is array-backed and addressed by slot."""
+
+    __slots__ = (
+        'id',
+        'room_id',
+        'room_owner_id',
+        'name',
+        'category',
+        'state',
+        'round',
+        'turn_time',
+        'last_tick_at',
+        'end_date',
+        'version',
+        'flushed_version',
+        'user_ids',
+        'joined_at',
+        'places',
+        'slots',
+        'points',
+        'standings',
+        'flushed_points',
+        'guessed',
+        'guessed_dictionary',
+        'guessed_dirty',
+    )
+
+    def __init__(self, head: Any, players: list[Any]) -> None:
+        self.id: UUID = head.id
+        self.room_id: UUID = head.room_id
+        self.room_owner_id: UUID = head.room_owner_id
+        self.name: str = head.name
+        self.category: str = head.category
+        self.state: str = head.state
+        self.round: int = head.round
+        self.turn_time: int = head.turn_time
+        self.last_tick_at: datetime = head.last_tick_at
+        self.end_date: datetime | None = head.end_date
+        self.version: int = head.version
+        self.flushed_version = self.version
+        self.user_ids: list[UUID] = [p.user_id for p in players]
+        self.joined_at: list[datetime] = [p.created_at for p in players]
+        self.places: list[int | None] = [p.place for p in players]
+        self.slots: dict[UUID, int] = {user_id: slot for slot, user_id in enumerate(self.user_ids)}
+        self.points = array('q', (p.points for p in players))
+        self.standings = Standings(self.user_ids, self.points, self.joined_at, self.places)
+        self.flushed_points = array('q', self.points)
+        self.guessed = bytearray(head.guessed or b'')
+        self.guessed_dictionary: int | None = head.guessed_dictionary
+        self.guessed_dirty = False
+
+
+class GameEngine:
+    """Authoritative in-memory state for running games with write-behind persistence.
+
+    Games are loaded on first use and then mutated only in memory; a background task flushes score deltas and clock
+    changes of dirty games in batched UPDATEs every ``flush_interval`` seconds and publishes ``GameChanged`` once they
+    are durable. The engine assumes it is the only writer of the games it holds, so a deployment enabling it must run a
+    single worker or route all requests of a game to the same worker.
+    """
+
+    def __init__(self, flush_interval: float, max_rounds: int) -> None:
+        self.flush_interval = flush_interval
+        self.max_rounds = max_rounds
+        self._games: dict[UUID, LiveGame] = {}
+        self._dirty: set[UUID] = set()
+        self._ending: set[UUID] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def peek(self, game_id: UUID) -> LiveGame | None:
+        return self._games.get(game_id)
+
+    async def acquire(self, game_id: UUID, session: AsyncSession) -> LiveGame | None:
+        live = self._games.get(game_id)
+        if live is not None:
+            return live
+        loaded = await self._load(game_id, session)
+        if loaded is None:
+            return None
+        return self._games.setdefault(game_id, loaded)
+
+    async def _load(self, game_id: UUID, session: AsyncSession) -> LiveGame | None:
+        rows = (
+            await session.execute(
+                select(
+                    GameModel.id,
+                    GameModel.room_id,
+                    RoomModel.room_owner_id,
+                    RoomModel.name,
+                    RoomModel.category,
+                    GameModel.state,
+                    GameModel.round,
+                    GameModel.turn_time,
+                    GameModel.last_tick_at,
+                    GameModel.end_date,
+                    GameModel.guessed,
+                    GameModel.guessed_dictionary,
+                    GameModel.version,
+                    GamePlayerModel.user_id,
+                    GamePlayerModel.points,
+                    GamePlayerModel.place,
+                    GamePlayerModel.created_at,
+                )
+                .join(RoomModel, RoomModel.id == GameModel.room_id)
+                .outerjoin(GamePlayerModel, GamePlayerModel.game_id == GameModel.id)
+                .where(GameModel.id == game_id, GameModel.state == GameState.RUNNING.value)
+            )
+        ).all()
+        if not rows:
+            return None
+        return LiveGame(rows[0], [row for row in rows if row.user_id is not None])
+
+    def guess(self, live: LiveGame, user_id: UUID, ordinal: int | None, fingerprint: int | None) -> bool:
+        """Scores a guess of the word ``ordinal`` in the dictionary compile ``fingerprint``; ``False`` if it does not count."""
+        slot = live.slots.get(user_id)
+        if slot is None or live.state != GameState.RUNNING.value:
+            return False
+        if live.guessed_dictionary != fingerprint:
+            live.guessed = guessed.load(bytes(live.guessed), live.guessed_dictionary, fingerprint)
+            live.guessed_dictionary = fingerprint
+            live.guessed_dirty = True
+        if ordinal is not None:
+            if guessed.contains(live.guessed, ordinal):
+                return False
+            guessed.add(live.guessed, ordinal)
+            live.guessed_dirty = True
+        live.standings.add(slot, 1)
+        live.version += 1
+        self._dirty.add(live.id)
+        return True
+
+    def tick(self, live: LiveGame) -> None:
+        if live.state != GameState.RUNNING.value:
+            return
+        now = datetime.now(timezone.utc)
+        if int((now - live.last_tick_at).total_seconds()) >= live.turn_time:
+            if live.round >= self.max_rounds:
+                self.finish(live)
+                return
+            live.round += 1
+        live.last_tick_at = now
+        self._touch_clock(live)
+
+    def advance_round(self, game_id: UUID, last_tick_at: datetime) -> bool:
+        live = self._games.get(game_id)
+        if live is None:
+            return False
+        if live.state == GameState.RUNNING.value and live.last_tick_at == last_tick_at:
+            if live.round >= self.max_rounds:
+                self.finish(live)
+                return True
+            live.round += 1
+            live.last_tick_at = datetime.now(timezone.utc)
+            self._touch_clock(live)
+        return True
+
+    def finish(self, live: LiveGame) -> None:
+        """Stops the game at once; places, user points and the room are settled by the next flush."""
+        if live.state != GameState.RUNNING.value:
+            return
+        live.state = GameState.ENDED.value
+        live.end_date = datetime.now(timezone.utc)
+        live.version += 1
+        self._dirty.add(live.id)
+        self._ending.add(live.id)
+        round_scheduler.forget(live.id)
+
+    def _touch_clock(self, live: LiveGame) -> None:
+        live.version += 1
+        self._dirty.add(live.id)
+        round_scheduler.schedule(live.id, live.last_tick_at, live.turn_time)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name='game-engine-flush')
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('game engine flush failed')
+
+    async def flush(self) -> None:
+        """Persists the dirty games.
+
+        Flushes run one at a time, so an older snapshot never commits over a newer one and a caller returns only once
+        everything changed before the call is durable.
+        """
+        async with self._flush_lock:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        ending, self._ending = self._ending, set()
+        now = datetime.now(timezone.utc)
+
+        flushed: list[tuple[LiveGame, array[int], int]] = []
+        head_rows: list[dict[str, Any]] = []
+        points_rows: list[dict[str, Any]] = []
+        guessed_rows: list[dict[str, Any]] = []
+        for game_id in dirty:
+            live = self._games.get(game_id)
+            if live is None:
+                continue
+            points = array('q', live.points)
+            for slot, (value, persisted) in enumerate(zip(points, live.flushed_points, strict=True)):
+                if value != persisted:
+                    points_rows.append(
+                        {
+                            'b_game_id': live.id,
+                            'b_user_id': live.user_ids[slot],
+                            'b_delta': value - persisted,
+                            'b_now': now,
+                        }
+                    )
+            if live.version != live.flushed_version:
+                head_rows.append(
+                    {
+                        'b_id': live.id,
+                        'b_state': live.state,
+                        'b_round': live.round,
+                        'b_last_tick_at': live.last_tick_at,
+                        'b_end_date': live.end_date,
+                        'b_version_delta': live.version - live.flushed_version,
+                        'b_now': now,
+                    }
+                )
+            if live.guessed_dirty:
+                live.guessed_dirty = False
+                guessed_rows.append(
+                    {
+                        'b_id': live.id,
+                        'b_guessed': bytes(live.guessed) or None,
+                        'b_guessed_dictionary': live.guessed_dictionary,
+                        'b_now': now,
+                    }
+                )
+            flushed.append((live, points, live.version))
+
+        try:
+            async with sqlalchemy_config.get_session() as session:
+                if points_rows:
+                    await session.execute(_FLUSH_POINTS, points_rows)
+                if guessed_rows:
+                    await session.execute(_FLUSH_GUESSED, guessed_rows)
+                # Completion claims games whose end_date is still NULL, so it runs before the heads carry theirs.
+                if ending:
+                    await complete_games(session, GameModel.id.in_(ending))
+                if head_rows:
+                    await session.execute(_FLUSH_HEAD, head_rows)
+                await session.commit()
+        except Exception:
+            self._dirty |= dirty
+            self._ending |= ending
+            for row in guessed_rows:
+                self._games[row['b_id']].guessed_dirty = True
+            raise
+
+        for live, points, version in flushed:
+            live.flushed_points = points
+            live.flushed_version = version
+            if live.state != GameState.RUNNING.value:
+                self._games.pop(live.id, None)
+            event_bus.publish(GameChanged(game_id=live.id))
+
+
+game_engine: GameEngine | None = None
+if settings.game_engine_enabled:
+    game_engine = GameEngine(
+        flush_interval=settings.game_engine_flush_interval,
+        max_rounds=settings.game_max_rounds,
+    )
+    round_scheduler.advance_locally(game_engine.advance_round)
@@ -0,0 +1,7 @@
+from uuid import UUID
+
+from app.core.events import Event
+
+
+class GameChanged(Event, frozen=True):
+    game_id: UUID
@@ -0,0 +1,23 @@
+"""Words already scored in a game, kept as a bitset over category dictionary ordinals.
+
+Bit ``n`` is byte ``n // 8``, mask ``1 << (n % 8)``. The set only grows as far as its highest ordinal, so it never
+takes more than one bit per dictionary word (12.5 KiB for 100k words). Ordinals are positions in one compile of the
+dictionary, so a bitset is stored with that compile's fingerprint and only read back under the same one.
+"""
+
+
+def load(bits: bytes | None, fingerprint: int | None, current: int | None) -> bytearray:
+    """Mutable copy of ``bits``, or an empty set if they index a compile other than the ``current`` one."""
+    return bytearray(bits or b'') if fingerprint == current else bytearray()
+
+
+def contains(bits: bytes | bytearray | None, ordinal: int) -> bool:
+    index = ordinal >> 3
+    return bits is not None and index < len(bits) and bool(bits[index] & (1 << (ordinal & 7)))
+
+
+def add(bits: bytearray, ordinal: int) -> None:
+    index = ordinal >> 3
+    if index >= len(bits):
+        bits.extend(bytes(index + 1 - len(bits)))
+    bits[index] |= 1 << (ordinal & 7)
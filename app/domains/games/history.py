@@ -0,0 +1,86 @@
+from collections import OrderedDict, deque
+from itertools import islice
+from uuid import UUID
+
+from app.core.settings import settings
+from app.domains.games.schemas import GamePlace, GamePoint
+from app.domains.games.standings import Standings
+
+
+class _Log:
+    """Last recorded points and places of one game, in ``user_id.hex`` order, and the changes that led to them."""
+
+    __slots__ = ('version', 'user_ids', 'points', 'places', 'changes')
+
+    def __init__(self, version: int, points: list[GamePoint], places: list[int], depth: int) -> None:
+        self.version = version
+        self.user_ids = [point.user_id for point in points]
+        self.points = [point.value for point in points]
+        self.places = places
+        # (version the change starts from, changed point indexes, changed place indexes)
+        self.changes: deque[tuple[int, list[int], list[int]]] = deque(maxlen=depth)
+
+
+class GameHistory:
+    """Ring buffers of recent changes to games' points and places, so clients can fetch only what changed.
+
+    Each version of a game served by this worker is recorded as the players whose points or places differ from the
+    previously recorded version. A client at a recorded version gets the union of the later changes; a version this
+    worker never served, or one older than the last ``depth`` changes, gets ``None`` and needs a full snapshot.
+    """
+
+    def __init__(self, depth: int, max_games: int) -> None:
+        self.depth = depth
+        self.max_games = max_games
+        self._logs: OrderedDict[UUID, _Log] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+    def record(self, game_id: UUID, version: int, standings: Standings) -> None:
+        points = standings.game_points()
+        by_user = {place.user_id: place.place for place in standings.game_places()}
+        places = [by_user[point.user_id] for point in points]
+
+        log = self._logs.get(game_id)
+        if log is not None:
+            self._logs.move_to_end(game_id)
+            if version <= log.version:
+                return
+            if len(points) == len(log.user_ids):
+                changed_points = [idx for idx, point in enumerate(points) if point.value != log.points[idx]]
+                changed_places = [idx for idx, place in enumerate(places) if place != log.places[idx]]
+                log.changes.append((log.version, changed_points, changed_places))
+                log.version = version
+                for idx in changed_points:
+                    log.points[idx] = points[idx].value
+                log.places = places
+                return
+
+        self._logs[game_id] = _Log(version, points, places, self.depth)
+        if len(self._logs) > self.max_games:
+            self._logs.popitem(last=False)
+
+    def changes_since(self, game_id: UUID, since: int, version: int) -> tuple[list[GamePoint], list[GamePlace]] | None:
+        """Points and places that changed from ``since`` to ``version``, or ``None`` if they are no longer known."""
+        log = self._logs.get(game_id)
+        if log is None or log.version != version:
+            return None
+        if since == version:
+            return [], []
+        start = next((pos for pos, change in enumerate(log.changes) if change[0] == since), None)
+        if start is None:
+            return None
+
+        changed_points: set[int] = set()
+        changed_places: set[int] = set()
+        for _, point_idxs, place_idxs in islice(log.changes, start, None):
+            changed_points.update(point_idxs)
+            changed_places.update(place_idxs)
+        return (
+            [GamePoint(user_id=log.user_ids[idx], value=log.points[idx]) for idx in sorted(changed_points)],
+            [GamePlace(user_id=log.user_ids[idx], place=log.places[idx]) for idx in sorted(changed_places)],
+        )
+
+
+game_history = GameHistory(depth=settings.game_history_depth, max_games=settings.game_history_max_games)
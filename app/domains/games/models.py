@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import UUID
 
 from advanced_alchemy.base import UUIDAuditBase
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import BigInteger, ForeignKey, LargeBinary, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.domains.rooms.models import RoomModel
@@ -28,13 +28,21 @@ class GameModel(UUIDAuditBase):
     last_tick_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(timezone.utc), nullable=False)
 
     end_date: Mapped[Optional[datetime]] = mapped_column(nullable=True)
-
-    room: Mapped[RoomModel] = relationship('RoomModel', lazy='selectin')
+    # Bitset of dictionary ordinals already scored, see app.domains.games.guessed. NULL means none yet.
+    guessed: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    # Fingerprint of the dictionary compile whose ordinals ``guessed`` holds.
+    guessed_dictionary: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    # Bumped by every write that changes the game as served to clients; used as its ETag.
+    version: Mapped[int] = mapped_column(default=1, nullable=False)
+
+    # Relationships are never loaded implicitly; each read asks for what it needs with loader options.
+    room: Mapped[RoomModel] = relationship('RoomModel', lazy='raise')
     players: Mapped[list['GamePlayerModel']] = relationship(
         'GamePlayerModel',
         back_populates='game',
         cascade='all, delete-orphan',
-        lazy='selectin',
+        passive_deletes=True,
+        lazy='raise',
     )
 
 
@@ -48,5 +56,5 @@ class GamePlayerModel(UUIDAuditBase):
     points: Mapped[int] = mapped_column(default=0, nullable=False)
     place: Mapped[Optional[int]] = mapped_column(nullable=True)
 
-    game: Mapped[GameModel] = relationship('GameModel', back_populates='players')
-    user: Mapped[UserModel] = relationship('UserModel', lazy='selectin')
+    game: Mapped[GameModel] = relationship('GameModel', back_populates='players', lazy='raise')
+    user: Mapped[UserModel] = relationship('UserModel', lazy='raise')
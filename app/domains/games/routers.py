@@ -1,14 +1,33 @@
-from typing import Any
+from typing import Any, Hashable
 from uuid import UUID
 
 from dishka.integrations.litestar import FromDishka
-from litestar import Controller, Request, get, post
+from litestar import Controller, Request, Response, get, post
+from litestar.response import Stream
 from litestar.security.jwt import Token
 
-from app.domains.games.schemas import Game, GuessRequest
+from app.core.events import event_bus
+from app.core.etag import ETAG_HEADER, IF_NONE_MATCH_HEADER, etag_matches, weak_etag
+from app.core.settings import settings
+from app.core.singleflight import SingleFlight
+from app.domains.games.broadcast import game_broadcaster
+from app.domains.games.events import GameChanged
+from app.domains.games.schemas import Game, GameDelta, GuessRequest
 from app.domains.games.services import GameService
 from app.domains.users.schemas import User
 
+game_reads = SingleFlight('games')
+event_bus.subscribe(GameChanged, lambda event: game_reads.forget_resource(event.game_id))
+
+
+async def _game_read_key(
+    request: Request[User, Token, Any], games_service: GameService, game_id: UUID, since: int | None = None
+) -> Hashable:
+    # Built without a database read: games held by the engine are keyed on their in-memory version, the rest are
+    # forgotten on GameChanged, so reads arriving after a change start a new flight either way.
+    version = games_service.peek_version(game_id)
+    return game_id, version, since, request.headers.get(IF_NONE_MATCH_HEADER)
+
 
 class RoomGamesController(Controller):
     path = '/rooms'
@@ -30,9 +49,35 @@ class GamesController(Controller):
     tags = ['games']
 
     @get('/{game_id:uuid}')
-    async def get_game(self, games_service: FromDishka[GameService], game_id: UUID) -> Game:
-        game = await games_service.get_game(game_id)
-        return await games_service.to_game_schema(game)
+    @game_reads(_game_read_key)
+    async def get_game(
+        self,
+        request: Request[User, Token, Any],
+        games_service: FromDishka[GameService],
+        game_id: UUID,
+        since: int | None = None,
+    ) -> Response[Game | GameDelta]:
+        if_none_match = request.headers.get(IF_NONE_MATCH_HEADER)
+        if if_none_match is not None:
+            etag = weak_etag(await games_service.get_version(game_id))
+            if etag_matches(if_none_match, etag):
+                return Response(None, status_code=304, headers={ETAG_HEADER: etag})
+        game = await games_service.get_state(game_id)
+        headers = {ETAG_HEADER: weak_etag(game.version)}
+        if since is not None:
+            delta = await games_service.to_game_delta(game, since)
+            if delta is not None:
+                return Response(delta, headers=headers)
+        return Response(await games_service.to_game_schema(game), headers=headers)
+
+    @get('/{game_id:uuid}/stream')
+    async def stream_game(self, game_id: UUID, since: int | None = None) -> Stream:
+        first = await game_broadcaster.snapshot(game_id, since)
+        return Stream(
+            game_broadcaster.subscribe(game_id, first, ping_interval=settings.game_stream_ping_interval),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
 
     @post('/{game_id:uuid}/guess')
     async def send_guess(
@@ -54,3 +99,13 @@ class GamesController(Controller):
     ) -> Game:
         game = await games_service.tick(game_id=game_id, actor_id=request.user.id)
         return await games_service.to_game_schema(game)
+
+    @post('/{game_id:uuid}/finish')
+    async def finish_game(
+        self,
+        request: Request[User, Token, Any],
+        games_service: FromDishka[GameService],
+        game_id: UUID,
+    ) -> Game:
+        game = await games_service.finish_game(game_id=game_id, actor_id=request.user.id)
+        return await games_service.to_game_schema(game)
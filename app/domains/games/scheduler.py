@@ -0,0 +1,194 @@
+import asyncio
+import heapq
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+from uuid import UUID
+
+import structlog
+from sqlalchemy import select, tuple_, update
+
+from app.core.database import sqlalchemy_config
+from app.core.events import event_bus
+from app.core.settings import settings
+from app.domains.games.completion import complete_games
+from app.domains.games.events import GameChanged
+from app.domains.games.models import GameModel, GameState
+
+logger = structlog.get_logger(__name__)
+
+LocalAdvance = Callable[[UUID, datetime], bool]
+
+
+class RoundScheduler:
+    """Advances rounds of running games when their turn time runs out.
+
+    Games are kept in a heap keyed by ``last_tick_at + turn_time``. Expired games are advanced with one batched UPDATE
+    guarded by the ``last_tick_at`` the scheduler last saw, so a manual ``/tick`` or another worker advancing the same
+    game first makes the guard miss, and the game is simply re-read and rescheduled. Games whose last round ran out
+    are completed in the same transaction instead.
+    """
+
+    def __init__(self, resync_interval: float, batch_size: int, max_rounds: int) -> None:
+        self.resync_interval = resync_interval
+        self.batch_size = batch_size
+        self.max_rounds = max_rounds
+        self._heap: list[tuple[float, UUID, datetime]] = []
+        self._games: dict[UUID, tuple[datetime, int]] = {}
+        self._unknown: set[UUID] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._local_advance: LocalAdvance | None = None
+
+    def advance_locally(self, advance: LocalAdvance) -> None:
+        """Routes due games to an in-memory owner first; it returns ``False`` for games it does not hold."""
+        self._local_advance = advance
+
+    def schedule(self, game_id: UUID, last_tick_at: datetime, turn_time: int) -> None:
+        self._games[game_id] = (last_tick_at, turn_time)
+        heapq.heappush(self._heap, (last_tick_at.timestamp() + turn_time, game_id, last_tick_at))
+        if self._heap[0][1] == game_id:
+            self._wakeup.set()
+
+    def forget(self, game_id: UUID) -> None:
+        self._games.pop(game_id, None)
+
+    def observe(self, game_id: UUID) -> None:
+        if game_id not in self._games:
+            self._unknown.add(game_id)
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name='round-scheduler')
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        next_resync = 0.0
+        while True:
+            try:
+                if time.monotonic() >= next_resync:
+                    await self._resync()
+                    next_resync = time.monotonic() + self.resync_interval
+                    self._unknown.clear()
+                if self._unknown:
+                    unknown, self._unknown = self._unknown, set()
+                    await self._reload(unknown)
+                await self._advance_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('round scheduler iteration failed')
+
+            timeout = next_resync - time.monotonic()
+            if self._heap:
+                timeout = min(timeout, self._heap[0][0] - time.time())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0.0))
+            except TimeoutError:
+                pass
+
+    def _pop_due(self) -> list[tuple[UUID, datetime]]:
+        now = time.time()
+        due: list[tuple[UUID, datetime]] = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            _, game_id, last_tick_at = heapq.heappop(self._heap)
+            tracked = self._games.get(game_id)
+            if tracked is None or tracked[0] != last_tick_at:
+                continue
+            due.append((game_id, last_tick_at))
+        return due
+
+    async def _advance_due(self) -> None:
+        while due := self._pop_due():
+            if self._local_advance is not None:
+                due = [
+                    (game_id, last_tick_at)
+                    for game_id, last_tick_at in due
+                    if not self._local_advance(game_id, last_tick_at)
+                ]
+                if not due:
+                    continue
+            now = datetime.now(timezone.utc)
+            try:
+                async with sqlalchemy_config.get_session() as session:
+                    result = await session.execute(
+                        update(GameModel)
+                        .where(
+                            GameModel.state == GameState.RUNNING.value,
+                            tuple_(GameModel.id, GameModel.last_tick_at).in_(due),
+                            GameModel.round < self.max_rounds,
+                        )
+                        .values(
+                            round=GameModel.round + 1, last_tick_at=now, version=GameModel.version + 1, updated_at=now
+                        )
+                        .returning(GameModel.id, GameModel.last_tick_at, GameModel.turn_time)
+                        .execution_options(synchronize_session=False)
+                    )
+                    advanced = result.all()
+                    ended = await complete_games(
+                        session,
+                        GameModel.state == GameState.RUNNING.value,
+                        tuple_(GameModel.id, GameModel.last_tick_at).in_(due),
+                        GameModel.round >= self.max_rounds,
+                    )
+                    await session.commit()
+            except Exception:
+                for game_id, last_tick_at in due:
+                    # Games forgotten while the batch ran (finished or deleted) stay forgotten.
+                    entry = self._games.get(game_id)
+                    if entry is not None:
+                        self.schedule(game_id, last_tick_at, entry[1])
+                raise
+
+            for row in advanced:
+                self.schedule(row.id, row.last_tick_at, row.turn_time)
+                event_bus.publish(GameChanged(game_id=row.id))
+
+            for game_id in ended:
+                self.forget(game_id)
+
+            missed = {game_id for game_id, _ in due} - {row.id for row in advanced} - set(ended)
+            if missed:
+                await self._reload(missed)
+
+    async def _resync(self) -> None:
+        await self._reload(None)
+
+    async def _reload(self, game_ids: Iterable[UUID] | None) -> None:
+        stmt = select(GameModel.id, GameModel.last_tick_at, GameModel.turn_time).where(
+            GameModel.state == GameState.RUNNING.value
+        )
+        if game_ids is not None:
+            game_ids = set(game_ids)
+            stmt = stmt.where(GameModel.id.in_(game_ids))
+
+        async with sqlalchemy_config.get_session() as session:
+            rows = (await session.execute(stmt)).all()
+
+        running = {row.id for row in rows}
+        tracked_ids = game_ids if game_ids is not None else set(self._games)
+        for stale_id in tracked_ids - running:
+            self.forget(stale_id)
+        for row in rows:
+            if game_ids is not None or self._games.get(row.id) != (row.last_tick_at, row.turn_time):
+                self.schedule(row.id, row.last_tick_at, row.turn_time)
+
+
+round_scheduler = RoundScheduler(
+    resync_interval=settings.game_scheduler_resync_interval,
+    batch_size=settings.game_scheduler_batch_size,
+    max_rounds=settings.game_max_rounds,
+)
+
+event_bus.subscribe(GameChanged, lambda event: round_scheduler.observe(event.game_id))
@@ -26,6 +26,25 @@ class Game(CamelizedBaseStruct):
     round: int
     turn_time: int
     time_left: int
+    last_tick_at: datetime
+    version: int
     points: list[GamePoint]
     places: list[GamePlace] = []
     end_date: datetime | None = None
+
+
+class GameDelta(CamelizedBaseStruct):
+    """Game fields at ``version``, with points and places only of the players whose values changed since ``since``."""
+
+    id: UUID
+    since: int
+    version: int
+    name: str
+    state: str
+    round: int
+    turn_time: int
+    time_left: int
+    last_tick_at: datetime
+    points: list[GamePoint]
+    places: list[GamePlace]
+    end_date: datetime | None = None
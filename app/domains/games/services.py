@@ -2,23 +2,55 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, Sequence
+from functools import partial
+from typing import NoReturn, cast
 from uuid import UUID
 
+import msgspec
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
-from litestar.exceptions import NotAuthorizedException, PermissionDeniedException
-
+from litestar.exceptions import (
+    HTTPException,
+    NotAuthorizedException,
+    NotFoundException,
+    PermissionDeniedException,
+    ValidationException,
+)
+from sqlalchemy import Integer, Table, exists, insert, literal, select, update
+from sqlalchemy.orm import joinedload
+
+from app.core.database import on_commit, random_uuid, sqlalchemy_config, update_from_values
+from app.core.events import event_bus
+from app.core.settings import settings
+from app.domains.dictionaries.engine import dictionaries
+from app.domains.games import guessed
+from app.domains.games.batching import PendingGuess, guess_batcher
 from app.domains.games.constants import (
+    ERR_GAME_NOT_FOUND,
     ERR_NO_PLAYERS_IN_ROOM,
     ERR_NOT_IN_GAME,
+    ERR_ONLY_OWNER_CAN_FINISH,
     ERR_ONLY_OWNER_CAN_START,
+    ERR_ROOM_NOT_FOUND,
     ERR_ROOM_NOT_OPEN,
+    ERR_UNKNOWN_WORD,
+    ERR_WORD_ALREADY_GUESSED,
 )
+from app.domains.games.broadcast import EncodedGame
+from app.domains.games.completion import complete_games
+from app.domains.games.engine import LiveGame, game_engine
+from app.domains.games.events import GameChanged
+from app.domains.games.history import game_history
 from app.domains.games.models import GameModel, GamePlayerModel, GameState
-from app.domains.games.schemas import Game, GamePlace, GamePoint
+from app.domains.games.scheduler import round_scheduler
+from app.domains.games.schemas import Game, GameDelta
+from app.domains.games.standings import Standings, snapshot_standings
+from app.domains.rooms.events import RoomChanged
 from app.domains.rooms.models import RoomModel, RoomPlayerModel, RoomStatus
-from app.domains.rooms.services import RoomPlayerRepository, RoomRepository
+
+
+_game_players_table = cast(Table, GamePlayerModel.__table__)
+_game_players = _game_players_table.c
 
 
 class GameRepository(SQLAlchemyAsyncRepository[GameModel]):
@@ -36,158 +68,442 @@ class _TimeInfo:
     left: int
 
 
+@dataclass
+class GameSnapshot:
+    id: UUID
+    room_id: UUID
+    name: str
+    state: str
+    round: int
+    turn_time: int
+    last_tick_at: datetime
+    end_date: datetime | None
+    version: int
+    standings: Standings
+
+
 class GameService(SQLAlchemyAsyncRepositoryService[GameModel]):
     repository_type = GameRepository
 
     def _players_repo(self) -> GamePlayerRepository:
         return GamePlayerRepository(session=self.repository.session)
 
-    def _rooms_repo(self) -> RoomRepository:
-        return RoomRepository(session=self.repository.session)
-
-    def _room_players_repo(self) -> RoomPlayerRepository:
-        return RoomPlayerRepository(session=self.repository.session)
-
-    async def get_game(self, game_id: UUID) -> GameModel:
-        return await self.repository.get(game_id)
-
-    async def start_game(self, room_id: UUID, actor_id: UUID) -> GameModel:
-        rooms_repo = self._rooms_repo()
-        room_players_repo = self._room_players_repo()
-
-        room = await rooms_repo.get(room_id)
-
-        if room.room_owner_id != actor_id:
-            raise PermissionDeniedException(detail=ERR_ONLY_OWNER_CAN_START)
-        if room.status != RoomStatus.OPEN.value:
-            raise NotAuthorizedException(detail=ERR_ROOM_NOT_OPEN)
-
-        players: Sequence[RoomPlayerModel] = await room_players_repo.list(RoomPlayerModel.room_id == room_id)
-        if not players:
-            raise NotAuthorizedException(detail=ERR_NO_PLAYERS_IN_ROOM)
-
+    async def get_state(self, game_id: UUID) -> GameSnapshot:
+        if game_engine is not None:
+            live = await game_engine.acquire(game_id, self.repository.session)
+            if live is not None:
+                return self._live_snapshot(live)
+        return await self.get_snapshot(game_id)
+
+    @staticmethod
+    def peek_version(game_id: UUID) -> int | None:
+        """Version of the game if the game engine holds it, without touching the database."""
+        if game_engine is None:
+            return None
+        live = game_engine.peek(game_id)
+        return live.version if live is not None else None
+
+    async def get_version(self, game_id: UUID) -> int:
+        """Current version of the game, read from memory or with a primary key lookup of one column."""
+        version = self.peek_version(game_id)
+        if version is not None:
+            return version
+        version = await self.repository.session.scalar(select(GameModel.version).where(GameModel.id == game_id))
+        if version is None:
+            raise NotFoundException(detail=ERR_GAME_NOT_FOUND)
+        return version
+
+    async def start_game(self, room_id: UUID, actor_id: UUID) -> GameSnapshot:
+        """Starts a game with everyone in the room, as a constant number of statements whatever the room size.
+
+        The room flips to ``in_game`` only from ``open`` and only for its owner, and the UPDATE waits on the room row
+        lock, so of two concurrent starts the second matches nothing. Players are copied with ``INSERT ... SELECT``.
+        """
+        session = self.repository.session
         now = datetime.now(timezone.utc)
-
-        game = await super().create(
-            {
-                'room_id': room.id,
-                'state': GameState.RUNNING.value,
-                'round': 1,
-                'turn_time': room.turn_time,
-                'last_tick_at': now,
-                'end_date': None,
-            }
-        )
-
-        gplayers_repo = self._players_repo()
-        await gplayers_repo.add_many(
-            [
-                GamePlayerModel(
-                    game_id=game.id,
-                    user_id=rp.user_id,
-                    points=0,
-                    place=None,
+        has_players = exists().where(RoomPlayerModel.room_id == RoomModel.id)
+        room = (
+            await session.execute(
+                update(RoomModel)
+                .where(
+                    RoomModel.id == room_id,
+                    RoomModel.room_owner_id == actor_id,
+                    RoomModel.status == RoomStatus.OPEN.value,
+                    has_players,
                 )
-                for rp in players
-            ],
+                .values(status=RoomStatus.IN_GAME.value, updated_at=now)
+                .returning(RoomModel.turn_time)
+                .execution_options(synchronize_session=False)
+            )
+        ).one_or_none()
+        if room is None:
+            await self._raise_not_startable(room_id, actor_id)
+
+        game_id = await session.scalar(
+            insert(GameModel)
+            .values(
+                room_id=room_id,
+                state=GameState.RUNNING.value,
+                round=1,
+                turn_time=room.turn_time,
+                last_tick_at=now,
+                end_date=None,
+            )
+            .returning(GameModel.id)
         )
-
-        await rooms_repo.get_and_update(
-            RoomModel.id == room.id,
-            attribute_names=('status',),
-            status=RoomStatus.IN_GAME.value,
+        await session.execute(
+            insert(GamePlayerModel).from_select(
+                ['id', 'game_id', 'user_id', 'points', 'created_at', 'updated_at'],
+                select(
+                    random_uuid(session),
+                    literal(game_id, GamePlayerModel.game_id.type),
+                    RoomPlayerModel.user_id,
+                    literal(0),
+                    literal(now, GamePlayerModel.created_at.type),
+                    literal(now, GamePlayerModel.updated_at.type),
+                )
+                .where(RoomPlayerModel.room_id == room_id)
+                .order_by(RoomPlayerModel.created_at),
+            )
         )
 
-        return await self.get_game(game.id)
-
-    async def tick(self, game_id: UUID, actor_id: UUID) -> GameModel:
-        game = await self.get_game(game_id)
-        room = game.room
+        # Scheduled only once the game is committed, so a rolled back start never gets a round timer.
+        on_commit(session, partial(round_scheduler.schedule, game_id, now, room.turn_time))
+        event_bus.publish_on_commit(session, GameChanged(game_id=game_id))
+        event_bus.publish_on_commit(session, RoomChanged(room_id=room_id))
+        return await self.get_snapshot(game_id)
+
+    async def _raise_not_startable(self, room_id: UUID, actor_id: UUID) -> NoReturn:
+        room = (
+            await self.repository.session.execute(
+                select(
+                    RoomModel.room_owner_id,
+                    RoomModel.status,
+                    exists().where(RoomPlayerModel.room_id == RoomModel.id).label('has_players'),
+                ).where(RoomModel.id == room_id)
+            )
+        ).one_or_none()
+        if room is None:
+            raise NotFoundException(detail=ERR_ROOM_NOT_FOUND)
         if room.room_owner_id != actor_id:
+            raise PermissionDeniedException(detail=ERR_ONLY_OWNER_CAN_START)
+        if room.status != RoomStatus.OPEN.value:
+            raise NotAuthorizedException(detail=ERR_ROOM_NOT_OPEN)
+        raise NotAuthorizedException(detail=ERR_NO_PLAYERS_IN_ROOM)
+
+    async def tick(self, game_id: UUID, actor_id: UUID) -> GameSnapshot:
+        if game_engine is not None:
+            live = await game_engine.acquire(game_id, self.repository.session)
+            if live is not None:
+                if live.room_owner_id != actor_id:
+                    raise PermissionDeniedException(detail='Only room owner can tick the game')
+                game_engine.tick(live)
+                return self._live_snapshot(live)
+
+        game = await self.repository.get(game_id, load=[joinedload(GameModel.room).load_only(RoomModel.room_owner_id)])
+        if game.room.room_owner_id != actor_id:
             raise PermissionDeniedException(detail='Only room owner can tick the game')
 
         if game.state != GameState.RUNNING.value:
-            return game
+            return await self.get_snapshot(game.id)
 
         t = self._compute_time(game)
-        now = t.now
-
-        new_round = game.round
-        if t.left <= 0:
-            new_round = game.round + 1
-
-        await self.repository.get_and_update(
-            GameModel.id == game.id,
-            attribute_names=('round', 'last_tick_at'),
-            round=new_round,
-            last_tick_at=now,
+        if t.left <= 0 and game.round >= settings.game_max_rounds:
+            await complete_games(
+                self.repository.session, GameModel.id == game.id, GameModel.state == GameState.RUNNING.value
+            )
+            round_scheduler.forget(game.id)
+            return await self.get_snapshot(game.id)
+        # Guarded by the clock read above, like the round scheduler's UPDATE: of concurrent ticks only the first moves it.
+        ticked = await self.repository.session.scalar(
+            update(GameModel)
+            .where(
+                GameModel.id == game.id,
+                GameModel.state == GameState.RUNNING.value,
+                GameModel.last_tick_at == game.last_tick_at,
+            )
+            .values(
+                round=GameModel.round + 1 if t.left <= 0 else GameModel.round,
+                last_tick_at=t.now,
+                version=GameModel.version + 1,
+                updated_at=t.now,
+            )
+            .returning(GameModel.id)
+            .execution_options(synchronize_session=False)
         )
-
-        return await self.get_game(game.id)
-
-    async def guess(self, game_id: UUID, user_id: UUID, text: str) -> GameModel:
-        game = await self.get_game(game_id)
-        if game.state != GameState.RUNNING.value:
-            return game
-
-        gplayers_repo = self._players_repo()
-        gplayer = await gplayers_repo.get_one_or_none(game_id=game_id, user_id=user_id)
-        if not gplayer:
-            raise NotAuthorizedException(detail=ERR_NOT_IN_GAME)
-
-        await gplayers_repo.get_and_update(
-            GamePlayerModel.id == gplayer.id,
-            attribute_names=('points',),
-            points=gplayer.points + 1,
+        if ticked is not None:
+            on_commit(self.repository.session, partial(round_scheduler.schedule, game.id, t.now, game.turn_time))
+            event_bus.publish_on_commit(self.repository.session, GameChanged(game_id=game.id))
+        return await self.get_snapshot(game.id)
+
+    async def finish_game(self, game_id: UUID, actor_id: UUID) -> GameSnapshot:
+        if game_engine is not None:
+            live = game_engine.peek(game_id)
+            if live is not None:
+                if live.room_owner_id != actor_id:
+                    raise PermissionDeniedException(detail=ERR_ONLY_OWNER_CAN_FINISH)
+                game_engine.finish(live)
+                await game_engine.flush()
+                return await self.get_snapshot(game_id)
+
+        owner_id = await self.repository.session.scalar(
+            select(RoomModel.room_owner_id)
+            .join(GameModel, GameModel.room_id == RoomModel.id)
+            .where(GameModel.id == game_id)
+        )
+        if owner_id is None:
+            raise NotFoundException(detail=ERR_GAME_NOT_FOUND)
+        if owner_id != actor_id:
+            raise PermissionDeniedException(detail=ERR_ONLY_OWNER_CAN_FINISH)
+        if await complete_games(
+            self.repository.session, GameModel.id == game_id, GameModel.state == GameState.RUNNING.value
+        ):
+            round_scheduler.forget(game_id)
+        return await self.get_snapshot(game_id)
+
+    async def guess(self, game_id: UUID, user_id: UUID, text: str) -> GameSnapshot:
+        if game_engine is not None:
+            live = await game_engine.acquire(game_id, self.repository.session)
+            if live is not None:
+                ordinal = self._check_word(live.category, text)
+                fingerprint = self._dictionary_fingerprint(live.category)
+                if not game_engine.guess(live, user_id, ordinal, fingerprint) and live.state == GameState.RUNNING.value:
+                    if user_id not in live.slots:
+                        raise NotAuthorizedException(detail=ERR_NOT_IN_GAME)
+                    raise ValidationException(detail=ERR_WORD_ALREADY_GUESSED)
+                return self._live_snapshot(live)
+
+        return await guess_batcher.submit(game_id, user_id, text)
+
+    async def apply_guesses(self, game_id: UUID, guesses: list[PendingGuess]) -> list[GameSnapshot | HTTPException]:
+        """Applies concurrent guesses of one game in a single transaction, in arrival order.
+
+        The game row is locked once for the whole batch, membership, dictionary and duplicate checks run in memory,
+        and all scores are added with one multi-row UPDATE. Every accepted guess gets the same post-batch snapshot.
+        """
+        session = self.repository.session
+        head = (
+            await session.execute(
+                select(RoomModel.category, GameModel.state, GameModel.guessed, GameModel.guessed_dictionary)
+                .join(GameModel, GameModel.room_id == RoomModel.id)
+                .where(GameModel.id == game_id)
+                .with_for_update(of=GameModel)
+            )
+        ).one_or_none()
+        if head is None:
+            return [NotFoundException(detail=ERR_GAME_NOT_FOUND) for _ in guesses]
+
+        players = set(
+            await session.scalars(
+                select(GamePlayerModel.user_id).where(
+                    GamePlayerModel.game_id == game_id,
+                    GamePlayerModel.user_id.in_({g.user_id for g in guesses}),
+                )
+            )
+        )
+        running = head.state == GameState.RUNNING.value
+        fingerprint = self._dictionary_fingerprint(head.category)
+        bits = guessed.load(head.guessed, head.guessed_dictionary, fingerprint)
+        deltas: dict[UUID, int] = {}
+        rejected: list[HTTPException | None] = []
+        for g in guesses:
+            try:
+                ordinal = self._check_word(head.category, g.text)
+                if running:
+                    if g.user_id not in players:
+                        raise NotAuthorizedException(detail=ERR_NOT_IN_GAME)
+                    if ordinal is not None:
+                        if guessed.contains(bits, ordinal):
+                            raise ValidationException(detail=ERR_WORD_ALREADY_GUESSED)
+                        guessed.add(bits, ordinal)
+                    deltas[g.user_id] = deltas.get(g.user_id, 0) + 1
+            except HTTPException as exc:
+                rejected.append(exc)
+            else:
+                rejected.append(None)
+
+        if deltas:
+            now = datetime.now(timezone.utc)
+            await update_from_values(
+                session,
+                {'user_id': GamePlayerModel.user_id.type, 'delta': Integer()},
+                list(deltas.items()),
+                lambda batch: (
+                    update(_game_players_table)
+                    .where(
+                        _game_players.game_id == game_id,
+                        _game_players.user_id == batch['user_id'],
+                    )
+                    .values(points=_game_players.points + batch['delta'], updated_at=now)
+                ),
+            )
+            await session.execute(
+                update(GameModel)
+                .where(GameModel.id == game_id)
+                .values(
+                    guessed=bytes(bits) or None,
+                    guessed_dictionary=fingerprint,
+                    version=GameModel.version + 1,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            event_bus.publish_on_commit(session, GameChanged(game_id=game_id))
+
+        snapshot = await self.get_snapshot(game_id)
+        return [exc if exc is not None else snapshot for exc in rejected]
+
+    @staticmethod
+    def _dictionary_fingerprint(category: str) -> int | None:
+        dictionary = dictionaries.get(category)
+        return dictionary.fingerprint if dictionary is not None else None
+
+    @staticmethod
+    def _check_word(category: str, text: str) -> int | None:
+        """Returns the ordinal of the dictionary word ``text`` stands for, allowing small typos in longer words."""
+        # Rooms in categories without a compiled dictionary accept any word.
+        dictionary = dictionaries.get(category)
+        if dictionary is None:
+            return None
+        max_distance = settings.guess_max_edit_distance if len(text.strip()) >= settings.guess_typo_min_length else 0
+        ordinal = dictionary.match(text, max_distance)
+        if ordinal is None:
+            raise ValidationException(detail=ERR_UNKNOWN_WORD)
+        return ordinal
+
+    async def get_snapshot(self, game_id: UUID) -> GameSnapshot:
+        rows = (
+            await self.repository.session.execute(
+                select(
+                    GameModel.id,
+                    GameModel.room_id,
+                    RoomModel.name,
+                    GameModel.state,
+                    GameModel.round,
+                    GameModel.turn_time,
+                    GameModel.last_tick_at,
+                    GameModel.end_date,
+                    GameModel.version,
+                    GamePlayerModel.user_id,
+                    GamePlayerModel.points,
+                    GamePlayerModel.place,
+                    GamePlayerModel.created_at,
+                )
+                .join(RoomModel, RoomModel.id == GameModel.room_id)
+                .outerjoin(GamePlayerModel, GamePlayerModel.game_id == GameModel.id)
+                .where(GameModel.id == game_id)
+                # The ranking order of ``Standings``, so it is taken as is instead of sorted per request.
+                .order_by(GamePlayerModel.points.desc(), GamePlayerModel.created_at)
+            )
+        ).all()
+        if not rows:
+            raise NotFoundException(detail=ERR_GAME_NOT_FOUND)
+
+        head = rows[0]
+        standings = snapshot_standings.get((head.id, head.version))
+        if standings is None:
+            players = [r for r in rows if r.user_id is not None]
+            standings = Standings(
+                [r.user_id for r in players],
+                [r.points for r in players],
+                [r.created_at for r in players],
+                [r.place for r in players],
+                ranked=True,
+            )
+            snapshot_standings.set((head.id, head.version), standings)
+        return GameSnapshot(
+            id=head.id,
+            room_id=head.room_id,
+            name=head.name,
+            state=head.state,
+            round=head.round,
+            turn_time=head.turn_time,
+            last_tick_at=head.last_tick_at,
+            end_date=head.end_date,
+            version=head.version,
+            standings=standings,
         )
 
-        return await self.get_game(game_id)
+    def _live_snapshot(self, live: LiveGame) -> GameSnapshot:
+        return GameSnapshot(
+            id=live.id,
+            room_id=live.room_id,
+            name=live.name,
+            state=live.state,
+            round=live.round,
+            turn_time=live.turn_time,
+            last_tick_at=live.last_tick_at,
+            end_date=live.end_date,
+            version=live.version,
+            standings=live.standings,
+        )
 
-    def _compute_time(self, game: GameModel) -> _TimeInfo:
+    def _compute_time(self, game: GameModel | GameSnapshot) -> _TimeInfo:
         now = datetime.now(timezone.utc)
         elapsed = int((now - game.last_tick_at).total_seconds())
         left = max(game.turn_time - elapsed, 0) if game.state == GameState.RUNNING.value else 0
         return _TimeInfo(now=now, elapsed=elapsed, left=left)
 
-    async def _compute_places(self, game: GameModel) -> list[GamePlace]:
-        explicit = [p for p in game.players if p.place is not None]
-        if explicit and len(explicit) == len(game.players):
-            return sorted(
-                [GamePlace(user_id=p.user_id, place=int(p.place)) for p in explicit],
-                key=lambda x: x.place,
-            )
-
-        ranked = sorted(
-            game.players,
-            key=lambda p: (-p.points, p.created_at),
-        )
-        places: list[GamePlace] = []
-        place = 1
-        last_points = None
-        for idx, gp in enumerate(ranked):
-            if last_points is None or gp.points < last_points:
-                place = idx + 1
-                last_points = gp.points
-            places.append(GamePlace(user_id=gp.user_id, place=place))
-        return places
-
-    async def to_game_schema(self, game: GameModel) -> Game:
+    async def to_game_schema(self, game: GameSnapshot) -> Game:
         t = self._compute_time(game)
-
-        points: Iterable[GamePoint] = [
-            GamePoint(user_id=gp.user_id, value=gp.points) for gp in sorted(game.players, key=lambda p: p.user_id.hex)
-        ]
-        places = await self._compute_places(game)
+        # Every version handed out can be the base of a later ``since`` request.
+        game_history.record(game.id, game.version, game.standings)
 
         return Game(
             id=game.id,
             room_id=game.room_id,
-            name=game.room.name if game.room else '',
+            name=game.name,
+            state=game.state,
+            round=game.round,
+            turn_time=game.turn_time,
+            time_left=t.left,
+            last_tick_at=game.last_tick_at,
+            version=game.version,
+            points=game.standings.game_points(),
+            places=game.standings.game_places(),
+            end_date=game.end_date,
+        )
+
+    async def to_game_delta(self, game: GameSnapshot, since: int) -> GameDelta | None:
+        """Changes of ``game`` since version ``since``; ``None`` when they are not known and a full snapshot is needed."""
+        game_history.record(game.id, game.version, game.standings)
+        changes = game_history.changes_since(game.id, since, game.version)
+        if changes is None:
+            return None
+        points, places = changes
+        t = self._compute_time(game)
+
+        return GameDelta(
+            id=game.id,
+            since=since,
+            version=game.version,
+            name=game.name,
             state=game.state,
             round=game.round,
             turn_time=game.turn_time,
             time_left=t.left,
-            points=list(points),
+            last_tick_at=game.last_tick_at,
+            points=points,
             places=places,
             end_date=game.end_date,
         )
+
+
+async def encode_game(game_id: UUID, since: int | None) -> EncodedGame:
+    async with sqlalchemy_config.get_session() as session:
+        service = GameService(session=session)
+        game = await service.get_state(game_id)
+        full = msgspec.json.encode(await service.to_game_schema(game))
+        delta = await service.to_game_delta(game, since) if since is not None else None
+        return EncodedGame(
+            version=game.version,
+            full=full,
+            delta=msgspec.json.encode(delta) if delta is not None else None,
+        )
+
+
+async def apply_guess_batch(game_id: UUID, guesses: list[PendingGuess]) -> list[GameSnapshot | HTTPException]:
+    async with sqlalchemy_config.get_session() as session:
+        outcomes = await GameService(session=session).apply_guesses(game_id, guesses)
+        await session.commit()
+        return outcomes
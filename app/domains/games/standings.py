@@ -0,0 +1,89 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Iterable, Iterator, MutableSequence, Sequence
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.settings import settings
+from app.domains.games.schemas import GamePlace, GamePoint
+
+
+def competition_places(points: Iterable[int]) -> Iterator[int]:
+    """Places for points listed best first; equal points share a place and skip the next ones."""
+    place = 0
+    last: int | None = None
+    for idx, value in enumerate(points, 1):
+        if value != last:
+            place = idx
+            last = value
+        yield place
+
+
+class Standings:
+    """Scores and ranking of one game's players, maintained as points change instead of re-sorted per response.
+
+    Players are addressed by slot. Points are reported ordered by ``user_id.hex``, which never changes, so that order is
+    computed once. Places follow ``(-points, joined_at, slot)`` keys kept sorted with bisect, so a score change moves a
+    single key; players passed already in that order (``ranked``) skip the initial sort. The ``GamePoint`` and
+    ``GamePlace`` lists handed to responses are built in one linear pass and shared until the next change. Stored
+    places (set when the game ends) take precedence over computed ones.
+    """
+
+    __slots__ = ('user_ids', 'points', 'joined_at', 'places', '_by_user', '_ranked', '_points_view', '_places_view')
+
+    def __init__(
+        self,
+        user_ids: Sequence[UUID],
+        points: MutableSequence[int],
+        joined_at: Sequence[datetime],
+        places: Sequence[int | None],
+        ranked: bool = False,
+    ) -> None:
+        self.user_ids = user_ids
+        self.points = points
+        self.joined_at = joined_at
+        self.places = places
+        self._by_user = sorted(range(len(user_ids)), key=lambda slot: user_ids[slot].hex)
+        keys = ((-points[slot], joined_at[slot], slot) for slot in range(len(user_ids)))
+        self._ranked = list(keys) if ranked else sorted(keys)
+        self._points_view: list[GamePoint] | None = None
+        self._places_view: list[GamePlace] | None = None
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    def add(self, slot: int, delta: int) -> None:
+        """Adds ``delta`` to the points of ``slot`` and moves the player to their new rank."""
+        joined_at = self.joined_at[slot]
+        del self._ranked[bisect_left(self._ranked, (-self.points[slot], joined_at, slot))]
+        self.points[slot] += delta
+        insort(self._ranked, (-self.points[slot], joined_at, slot))
+        self._points_view = None
+        self._places_view = None
+
+    def game_points(self) -> list[GamePoint]:
+        if self._points_view is None:
+            self._points_view = [
+                GamePoint(user_id=self.user_ids[slot], value=self.points[slot]) for slot in self._by_user
+            ]
+        return self._points_view
+
+    def game_places(self) -> list[GamePlace]:
+        if self._places_view is None:
+            final = bool(self.places) and all(place is not None for place in self.places)
+            computed = competition_places(-negated_points for negated_points, _, _ in self._ranked)
+            places: list[GamePlace] = []
+            for (_, _, slot), place in zip(self._ranked, computed, strict=True):
+                stored = self.places[slot] if final else None
+                places.append(GamePlace(user_id=self.user_ids[slot], place=place if stored is None else stored))
+            self._places_view = places
+        return self._places_view
+
+
+# Standings of snapshots read from the database, by (game id, version). A version pins the points and places it was
+# read with, so an entry is never stale, and reads of an unchanged game skip building and ordering them again.
+snapshot_standings: TTLCache[tuple[UUID, int], Standings] = TTLCache(
+    name='game_standings',
+    maxsize=settings.game_standings_cache_size,
+    ttl=settings.game_standings_cache_ttl,
+)
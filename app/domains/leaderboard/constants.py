@@ -0,0 +1,2 @@
+ERR_INVALID_CURSOR = 'Invalid leaderboard cursor'
+ERR_NOT_RANKED = 'User is not on the leaderboard'
@@ -0,0 +1,103 @@
+from bisect import bisect_left, insort
+from typing import Iterable, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.core.database import sqlalchemy_config
+from app.core.events import event_bus
+from app.domains.users.events import UserRankChanged
+from app.domains.users.models import UserModel
+
+
+class RankedUser(NamedTuple):
+    user_id: UUID
+    username: str
+    points: int
+    avatar_url: str | None
+
+
+_Key = tuple[int, str, UUID]
+
+
+class LeaderboardEngine:
+    """In-memory order-statistic index over ``(points DESC, username, user_id)``.
+
+    Keys live in a sorted array, so a rank lookup is a single bisect. Places follow the same ordering as
+    ``GET /leaderboard``, which makes ``/leaderboard/me`` and the paginated list agree.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[_Key] = []
+        self._users: dict[UUID, RankedUser] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _key(user: RankedUser) -> _Key:
+        return -user.points, user.username, user.user_id
+
+    def load(self, users: Iterable[RankedUser]) -> None:
+        self._users = {u.user_id: u for u in users}
+        self._keys = sorted(self._key(u) for u in self._users.values())
+        self.loaded = True
+
+    async def load_from_db(self) -> None:
+        async with sqlalchemy_config.get_session() as session:
+            rows = await session.execute(
+                select(UserModel.id, UserModel.username, UserModel.points, UserModel.avatar_url)
+            )
+            self.load(RankedUser(*row) for row in rows)
+
+    def upsert(self, user: RankedUser) -> None:
+        current = self._users.get(user.user_id)
+        if current is not None:
+            if current == user:
+                return
+            self._remove_key(self._key(current))
+        self._users[user.user_id] = user
+        insort(self._keys, self._key(user))
+
+    def remove(self, user_id: UUID) -> None:
+        current = self._users.pop(user_id, None)
+        if current is not None:
+            self._remove_key(self._key(current))
+
+    def _remove_key(self, key: _Key) -> None:
+        idx = bisect_left(self._keys, key)
+        if idx < len(self._keys) and self._keys[idx] == key:
+            del self._keys[idx]
+
+    def _index(self, user_id: UUID) -> int | None:
+        user = self._users.get(user_id)
+        if user is None:
+            return None
+        return bisect_left(self._keys, self._key(user))
+
+    def rank(self, user_id: UUID) -> tuple[int, RankedUser] | None:
+        idx = self._index(user_id)
+        if idx is None:
+            return None
+        return idx + 1, self._users[user_id]
+
+    def around(self, user_id: UUID, radius: int) -> list[tuple[int, RankedUser]]:
+        idx = self._index(user_id)
+        if idx is None:
+            return []
+        start = max(idx - radius, 0)
+        end = min(idx + radius + 1, len(self._keys))
+        return [(i + 1, self._users[self._keys[i][2]]) for i in range(start, end)]
+
+
+leaderboard_engine = LeaderboardEngine()
+
+
+def _on_rank_changed(event: UserRankChanged) -> None:
+    leaderboard_engine.upsert(
+        RankedUser(user_id=event.user_id, username=event.username, points=event.points, avatar_url=event.avatar_url)
+    )
+
+
+event_bus.subscribe(UserRankChanged, _on_rank_changed)
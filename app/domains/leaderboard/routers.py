@@ -1,8 +1,33 @@
+from typing import Annotated, Any, Hashable
+from uuid import UUID
+
 from dishka.integrations.litestar import FromDishka
-from litestar import Controller, get
+from litestar import Controller, Request, Response, get
+from litestar.exceptions import NotFoundException
+from litestar.params import Parameter
+from litestar.security.jwt import Token
 
+from app.core.events import event_bus
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.response_cache import ResponseCache
+from app.core.settings import settings
+from app.domains.leaderboard.constants import ERR_NOT_RANKED
+from app.domains.leaderboard.engine import LeaderboardEngine, RankedUser
 from app.domains.leaderboard.schemas import LeaderboardEntry
-from app.domains.leaderboard.services import LeaderboardService
+from app.domains.leaderboard.services import LeaderboardCursor, LeaderboardService
+from app.domains.users.events import UserRankChanged
+from app.domains.users.schemas import User
+
+top_responses = ResponseCache('leaderboard', ttl=settings.leaderboard_cache_ttl)
+
+
+async def _top_page_key(limit: int, cursor: str | None = None, **_: Any) -> Hashable | None:
+    # Only the top page is read by everyone; pages after a cursor are spread too thin to be worth keeping.
+    return limit if cursor is None else None
+
+
+def _to_entry(place: int, user: RankedUser) -> LeaderboardEntry:
+    return LeaderboardEntry(username=user.username, avatar_url=user.avatar_url, points=user.points, place=place)
 
 
 class LeaderboardController(Controller):
@@ -10,19 +35,51 @@ class LeaderboardController(Controller):
     tags = ['leaderboard']
 
     @get()
+    @top_responses(_top_page_key)
     async def get_leaderboard(
         self,
         leaderboard_service: FromDishka[LeaderboardService],
-        limit: int = 100,
-        offset: int = 0,
-    ) -> list[LeaderboardEntry]:
-        users = await leaderboard_service.list_top_users(limit=limit, offset=offset)
-        return [
+        limit: Annotated[int, Parameter(ge=1, le=500)] = 100,
+        cursor: str | None = None,
+    ) -> Response[list[LeaderboardEntry]]:
+        after = LeaderboardCursor.decode(cursor) if cursor else None
+        users, next_cursor = await leaderboard_service.list_top_users(limit=limit, after=after)
+        start = after.place if after is not None else 0
+        entries = [
             LeaderboardEntry(
                 username=u.username,
                 avatar_url=u.avatar_url,
                 points=u.points,
-                place=offset + i + 1,
+                place=start + i + 1,
             )
             for i, u in enumerate(users)
         ]
+        headers = {NEXT_CURSOR_HEADER: next_cursor.encode()} if next_cursor is not None else {}
+        return Response(entries, headers=headers)
+
+    @get('/me')
+    async def get_my_rank(
+        self,
+        request: Request[User, Token, Any],
+        leaderboard_engine: FromDishka[LeaderboardEngine],
+    ) -> LeaderboardEntry:
+        ranked = leaderboard_engine.rank(request.user.id)
+        if ranked is None:
+            raise NotFoundException(detail=ERR_NOT_RANKED)
+        return _to_entry(*ranked)
+
+    @get('/around/{user_id:uuid}')
+    async def get_around(
+        self,
+        leaderboard_engine: FromDishka[LeaderboardEngine],
+        user_id: UUID,
+        radius: Annotated[int, Parameter(ge=0, le=50)] = 5,
+    ) -> list[LeaderboardEntry]:
+        around = leaderboard_engine.around(user_id, radius=radius)
+        if not around:
+            raise NotFoundException(detail=ERR_NOT_RANKED)
+        return [_to_entry(place, user) for place, user in around]
+
+
+# Any points change can reorder the top page.
+event_bus.subscribe(UserRankChanged, lambda _: top_responses.invalidate())
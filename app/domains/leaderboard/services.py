@@ -2,7 +2,10 @@ from typing import Sequence
 
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
+from sqlalchemy import and_, or_, select
 
+from app.core.pagination import Cursor
+from app.domains.leaderboard.constants import ERR_INVALID_CURSOR
 from app.domains.users.models import UserModel
 
 
@@ -10,12 +13,36 @@ class LeaderboardRepository(SQLAlchemyAsyncRepository[UserModel]):
     model_type = UserModel
 
 
+class LeaderboardCursor(Cursor):
+    invalid_detail = ERR_INVALID_CURSOR
+
+    points: int
+    username: str
+    place: int
+
+
 class LeaderboardService(SQLAlchemyAsyncRepositoryService[UserModel]):
     repository_type = LeaderboardRepository
 
-    async def list_top_users(self, limit: int = 100, offset: int = 0) -> Sequence[UserModel]:
-        return await self.repository.list(
-            order_by=[('points', True), ('username', False)],
-            limit=limit,
-            offset=offset,
-        )
+    async def list_top_users(
+        self,
+        limit: int = 100,
+        after: LeaderboardCursor | None = None,
+    ) -> tuple[Sequence[UserModel], LeaderboardCursor | None]:
+        stmt = select(UserModel).order_by(UserModel.points.desc(), UserModel.username.asc()).limit(limit + 1)
+        if after is not None:
+            stmt = stmt.where(
+                and_(
+                    UserModel.points <= after.points,
+                    or_(UserModel.points < after.points, UserModel.username > after.username),
+                )
+            )
+
+        users = (await self.repository.session.execute(stmt)).scalars().all()
+        if len(users) <= limit:
+            return users, None
+
+        users = users[:limit]
+        last = users[-1]
+        start = after.place if after is not None else 0
+        return users, LeaderboardCursor(points=last.points, username=last.username, place=start + limit)
@@ -0,0 +1,102 @@
+"""Benchmark building and encoding room responses with their players.
+
+Compares converting ORM members one by one through ``UserService.to_schema`` with building all players of a page
+of rooms from row tuples in one pass.
+
+Usage: python -m app.domains.rooms.bench [ROOMS] [PLAYERS_PER_ROOM]
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+import msgspec
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.domains.rooms.models import RoomPlayerModel
+from app.domains.rooms.schemas import Player
+from app.domains.rooms.services import RoomService
+from app.domains.users.models import UserModel
+from app.domains.users.schemas import UserPublic
+from app.domains.users.services import UserService
+
+ROUNDS = 20
+
+
+def _per_round_ms(fn: Callable[[], object]) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - started) / ROUNDS * 1e3
+
+
+def main(argv: list[str]) -> None:
+    rooms = int(argv[0]) if argv else 100
+    per_room = int(argv[1]) if len(argv) > 1 else 20
+    now = datetime.now(timezone.utc)
+
+    rows: list[tuple[Any, ...]] = []
+    links: dict[UUID, list[RoomPlayerModel]] = {}
+    for _ in range(rooms):
+        room_id = uuid4()
+        links[room_id] = []
+        for seat in range(per_room):
+            user = UserModel(
+                id=uuid4(),
+                email=f'player{seat}@example.com',
+                username=f'player-{uuid4().hex[:12]}',
+                hashed_password='',
+                status='ready',
+                points=seat * 10,
+                created_at=now,
+            )
+            link = RoomPlayerModel(room_id=room_id, user_id=user.id, created_at=now)
+            link.user = user
+            links[room_id].append(link)
+            rows.append(
+                (
+                    room_id,
+                    now,
+                    seat == 0,
+                    user.id,
+                    user.email,
+                    user.username,
+                    user.name,
+                    user.status,
+                    user.avatar_url,
+                    user.banner_url,
+                    user.points,
+                    user.created_at,
+                )
+            )
+
+    session = AsyncSession(create_async_engine('sqlite+aiosqlite://'))
+
+    def per_player() -> bytes:
+        page = {
+            room_id: [
+                Player(
+                    user=UserService(session=session).to_schema(link.user, schema_type=UserPublic),
+                    joined_at=link.created_at,
+                    is_owner=seat == 0,
+                )
+                for seat, link in enumerate(members)
+            ]
+            for room_id, members in links.items()
+        }
+        return msgspec.json.encode(page)
+
+    def bulk() -> bytes:
+        return msgspec.json.encode(RoomService.to_player_schemas(rows))
+
+    assert msgspec.json.decode(per_player()) == msgspec.json.decode(bulk())
+    print(f'{rooms} rooms x {per_room} players, {len(bulk()) / 2**10:.0f} KiB encoded')
+    for label, fn in (('per-player', per_player), ('bulk', bulk)):
+        print(f'{label:>10}: {_per_round_ms(fn):7.2f} ms/page')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -7,3 +7,4 @@ ERR_INVALID_ROOM_PASSWORD = 'Invalid room password'
 ERR_ONLY_OWNER_KICK = 'Only owner can kick players'
 ERR_OWNER_CANNOT_KICK_SELF = 'Owner cannot kick themselves'
 ERR_PLAYER_NOT_IN_ROOM = 'Player is not in the room'
+ERR_INVALID_ROOM_CURSOR = 'Invalid rooms cursor'
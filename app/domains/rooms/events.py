@@ -0,0 +1,7 @@
+from uuid import UUID
+
+from app.core.events import Event
+
+
+class RoomChanged(Event, frozen=True):
+    room_id: UUID
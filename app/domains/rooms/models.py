@@ -3,7 +3,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from advanced_alchemy.base import UUIDAuditBase
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.domains.users.models import UserModel
@@ -22,7 +22,7 @@ class RoomModel(UUIDAuditBase):
     category: Mapped[str] = mapped_column(String(50), index=True, nullable=False)
 
     room_owner_id: Mapped[UUID] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
-    owner: Mapped[UserModel] = relationship('UserModel', lazy='selectin')
+    owner: Mapped[UserModel] = relationship('UserModel', lazy='raise')
 
     players_limit: Mapped[int] = mapped_column(nullable=False)
     turn_time: Mapped[int] = mapped_column(nullable=False)  # seconds
@@ -37,7 +37,8 @@ class RoomModel(UUIDAuditBase):
         'RoomPlayerModel',
         back_populates='room',
         cascade='all, delete-orphan',
-        lazy='selectin',
+        passive_deletes=True,
+        lazy='raise',
     )
 
 
@@ -48,7 +49,14 @@ class RoomPlayerModel(UUIDAuditBase):
     room_id: Mapped[UUID] = mapped_column(ForeignKey('rooms.id', ondelete='CASCADE'), index=True, nullable=False)
     user_id: Mapped[UUID] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'), index=True, nullable=False)
 
-    is_owner: Mapped[bool] = mapped_column(default=False, nullable=False)
+    room: Mapped[RoomModel] = relationship('RoomModel', back_populates='players', lazy='raise')
+    user: Mapped[UserModel] = relationship('UserModel', lazy='raise')
 
-    room: Mapped[RoomModel] = relationship('RoomModel', back_populates='players')
-    user: Mapped[UserModel] = relationship('UserModel', lazy='selectin')
+
+Index('ix_rooms_created_at_id', RoomModel.created_at.desc(), RoomModel.id.desc())
+Index(
+    'ix_rooms_name_trgm',
+    RoomModel.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'},
+)
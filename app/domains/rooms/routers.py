@@ -1,28 +1,42 @@
-from typing import Any
-from uuid import UUID, uuid4
+from typing import Annotated, Any, Hashable
+from uuid import NAMESPACE_URL, UUID, uuid5
 
 from dishka.integrations.litestar import FromDishka
-from litestar import Controller, Request, delete, get, patch, post
+from litestar import Controller, Request, Response, delete, get, patch, post
+from litestar.params import Parameter
 from litestar.security.jwt import Token
 
+from app.core.events import event_bus
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.response_cache import ResponseCache
+from app.core.settings import settings
+from app.core.singleflight import SingleFlight
+from app.domains.dictionaries.engine import dictionaries
+from app.domains.rooms.events import RoomChanged
 from app.domains.rooms.schemas import (
     Category,
     CreateRoomRequest,
     JoinRoomRequest,
     Player,
     Room,
+    RoomSummary,
     UpdateRoomRequest,
 )
-from app.domains.rooms.services import RoomService
+from app.domains.rooms.services import RoomCursor, RoomService
 from app.domains.users.schemas import User
 
-_DEFAULT_CATEGORIES = [  # TODO: убрать
-    Category(id=uuid4(), name='Animals'),
-    Category(id=uuid4(), name='Food'),
-    Category(id=uuid4(), name='Geography'),
-    Category(id=uuid4(), name='Movies'),
-    Category(id=uuid4(), name='Music'),
-]
+room_reads = SingleFlight('rooms')
+event_bus.subscribe(RoomChanged, lambda event: room_reads.forget_resource(event.room_id))
+category_responses = ResponseCache('categories', ttl=settings.categories_cache_ttl)
+
+
+async def _categories_key(**_: Any) -> Hashable:
+    return ()
+
+
+async def _room_read_key(room_id: UUID, **_: Any) -> Hashable:
+    # Forgotten on RoomChanged, so reads arriving after a change start a new flight without a version read here.
+    return (room_id,)
 
 
 class CategoriesController(Controller):
@@ -30,8 +44,11 @@ class CategoriesController(Controller):
     tags = ['rooms']
 
     @get()
+    @category_responses(_categories_key)
     async def list_categories(self) -> list[Category]:
-        return _DEFAULT_CATEGORIES
+        return [
+            Category(id=uuid5(NAMESPACE_URL, f'wordcon:category:{name}'), name=name) for name in dictionaries.names()
+        ]
 
 
 class RoomsController(Controller):
@@ -45,9 +62,19 @@ class RoomsController(Controller):
         category: str | None = None,
         q: str | None = None,
         status: str | None = None,
-    ) -> list[Room]:
-        rooms = await rooms_service.list_rooms(category=category, q=q, status=status)
-        return [await rooms_service.to_room_schema(r) for r in rooms]
+        limit: Annotated[int, Parameter(ge=1, le=100)] = 50,
+        cursor: str | None = None,
+    ) -> Response[list[RoomSummary]]:
+        after = RoomCursor.decode(cursor) if cursor else None
+        rows, next_cursor = await rooms_service.list_room_summaries(
+            category=category,
+            q=q,
+            status=status,
+            limit=limit,
+            after=after,
+        )
+        headers = {NEXT_CURSOR_HEADER: next_cursor.encode()} if next_cursor is not None else {}
+        return Response([rooms_service.to_room_summary_schema(r) for r in rows], headers=headers)
 
     @post()
     async def create_room(
@@ -60,6 +87,7 @@ class RoomsController(Controller):
         return await rooms_service.to_room_schema(room)
 
     @get('/{room_id:uuid}')
+    @room_reads(_room_read_key)
     async def get_room(
         self,
         rooms_service: FromDishka[RoomService],
@@ -97,8 +125,8 @@ class RoomsController(Controller):
         data: JoinRoomRequest | None = None,
     ) -> Room:
         password = data.password if data is not None else None
-        room = await rooms_service.join_room(room_id=room_id, user_id=request.user.id, password=password)
-        return await rooms_service.to_room_schema(room)
+        room, players = await rooms_service.join_room(room_id=room_id, user_id=request.user.id, password=password)
+        return await rooms_service.to_room_schema(room, players)
 
     @post('/{room_id:uuid}/leave', status_code=204)
     async def leave_room(
@@ -115,8 +143,8 @@ class RoomsController(Controller):
         rooms_service: FromDishka[RoomService],
         room_id: UUID,
     ) -> list[Player]:
-        room = await rooms_service.get_room(room_id)
-        return [await rooms_service.to_player_schema(p) for p in room.players]
+        await rooms_service.get_room(room_id)
+        return (await rooms_service.players_by_room([room_id])).get(room_id, [])
 
     @delete('/{room_id:uuid}/players/{user_id:uuid}', status_code=204)
     async def kick_player(
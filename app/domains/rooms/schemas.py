@@ -1,8 +1,8 @@
 from datetime import datetime
-from typing import Any
 from uuid import UUID
 
 from app.core.schemas import CamelizedBaseStruct
+from app.domains.users.schemas import UserPublic
 
 
 class Category(CamelizedBaseStruct):
@@ -29,7 +29,7 @@ class UpdateRoomRequest(CamelizedBaseStruct):
 
 
 class Player(CamelizedBaseStruct):
-    user: Any
+    user: UserPublic
     joined_at: datetime | None = None
     is_owner: bool = False
 
@@ -48,5 +48,20 @@ class Room(CamelizedBaseStruct):
     created_at: datetime | None = None
 
 
+class RoomSummary(CamelizedBaseStruct):
+    id: UUID
+    name: str
+    category: str
+    room_owner: UUID
+    owner_name: str
+    players_count: int
+    players_limit: int
+    turn_time: int
+    status: str
+    is_private: bool = False
+    has_password: bool = False
+    created_at: datetime | None = None
+
+
 class JoinRoomRequest(CamelizedBaseStruct):
     password: str | None = None
@@ -0,0 +1,107 @@
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import sqlalchemy_config
+from app.core.events import event_bus
+from app.core.settings import settings
+from app.domains.rooms.events import RoomChanged
+from app.domains.rooms.models import RoomModel
+
+GRAM_SIZE = 3
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i : i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class RoomNameIndex:
+    """In-process trigram inverted index over room names for databases without pg_trgm.
+
+    A query is answered by intersecting the posting sets of its trigrams and confirming the substring on the stored
+    names. ``search`` returns ``None`` when the index cannot help (queries shorter than a trigram or matching too many
+    rooms), in which case the caller falls back to a plain ``ILIKE``. Changed rooms are only marked dirty and re-read
+    on the next ``refresh``. The index learns about new and renamed rooms only through ``RoomChanged``, so it is only
+    enabled when the app runs a single worker or the event bus reaches every worker; otherwise a worker would miss the
+    rooms created through the others and searches use ``ILIKE``.
+    """
+
+    def __init__(self, max_candidates: int) -> None:
+        self.max_candidates = max_candidates
+        self._postings: defaultdict[str, set[UUID]] = defaultdict(set)
+        self._names: dict[UUID, str] = {}
+        self._dirty: set[UUID] = set()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, room_id: UUID, name: str) -> None:
+        name = name.lower()
+        if self._names.get(room_id) == name:
+            return
+        self.remove(room_id)
+        self._names[room_id] = name
+        for gram in _grams(name):
+            self._postings[gram].add(room_id)
+
+    def remove(self, room_id: UUID) -> None:
+        name = self._names.pop(room_id, None)
+        if name is None:
+            return
+        for gram in _grams(name):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(room_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def notify(self, room_id: UUID) -> None:
+        self._dirty.add(room_id)
+
+    async def load_from_db(self) -> None:
+        async with sqlalchemy_config.get_session() as session:
+            rows = await session.execute(select(RoomModel.id, RoomModel.name))
+            self._postings.clear()
+            self._names.clear()
+            self._dirty.clear()
+            for room_id, name in rows:
+                self.add(room_id, name)
+
+    async def refresh(self, session: AsyncSession) -> None:
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        try:
+            rows = (await session.execute(select(RoomModel.id, RoomModel.name).where(RoomModel.id.in_(dirty)))).all()
+        except Exception:
+            self._dirty |= dirty
+            raise
+        for room_id in dirty - {row.id for row in rows}:
+            self.remove(room_id)
+        for row in rows:
+            self.add(row.id, row.name)
+
+    def search(self, q: str) -> set[UUID] | None:
+        q = q.lower()
+        grams = sorted(_grams(q), key=lambda gram: len(self._postings.get(gram, ())))
+        if not grams:
+            return None
+
+        candidates = set(self._postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._postings.get(gram, set())
+
+        matches = {room_id for room_id in candidates if q in self._names[room_id]}
+        if len(matches) > self.max_candidates:
+            return None
+        return matches
+
+
+room_name_index: RoomNameIndex | None = None
+if not settings.database_url.startswith('postgresql') and (event_bus.backend.fans_out or settings.web_concurrency == 1):
+    room_name_index = RoomNameIndex(max_candidates=settings.room_search_max_candidates)
+    event_bus.subscribe(RoomChanged, lambda event: room_name_index.notify(event.room_id))  # type: ignore[union-attr]
@@ -1,5 +1,7 @@
-from typing import Any, Iterable, Sequence
-from uuid import UUID
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Collection, Iterable, Sequence
+from uuid import UUID, uuid4
 
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
@@ -8,9 +10,14 @@ from litestar.exceptions import (
     NotFoundException,
     PermissionDeniedException,
 )
+from sqlalchemy import ColumnElement, Row, and_, delete, exists, func, insert, literal, or_, select, update
 
 from app.core import crypt
+from app.core.events import event_bus
+from app.core.pagination import Cursor
+from app.domains.games.models import GameModel
 from app.domains.rooms.constants import (
+    ERR_INVALID_ROOM_CURSOR,
     ERR_INVALID_ROOM_PASSWORD,
     ERR_ONLY_OWNER_DELETE,
     ERR_ONLY_OWNER_KICK,
@@ -19,11 +26,14 @@ from app.domains.rooms.constants import (
     ERR_PASSWORD_REQUIRED,
     ERR_PLAYER_NOT_IN_ROOM,
     ERR_ROOM_FULL,
+    ERR_ROOM_NOT_FOUND,
 )
+from app.domains.rooms.events import RoomChanged
 from app.domains.rooms.models import RoomModel, RoomPlayerModel, RoomStatus
-from app.domains.rooms.schemas import Player, Room
+from app.domains.rooms.schemas import Player, Room, RoomSummary
+from app.domains.rooms.search import room_name_index
+from app.domains.users.models import UserModel
 from app.domains.users.schemas import UserPublic
-from app.domains.users.services import UserService
 
 
 class RoomRepository(SQLAlchemyAsyncRepository[RoomModel]):
@@ -34,12 +44,43 @@ class RoomPlayerRepository(SQLAlchemyAsyncRepository[RoomPlayerModel]):
     model_type = RoomPlayerModel
 
 
+class RoomCursor(Cursor):
+    invalid_detail = ERR_INVALID_ROOM_CURSOR
+
+    created_at: datetime
+    id: UUID
+
+
+# A member's public profile, in the field order of ``UserPublic``.
+_USER_PUBLIC_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.username,
+    UserModel.name,
+    UserModel.status,
+    UserModel.avatar_url,
+    UserModel.banner_url,
+    UserModel.points,
+    UserModel.created_at,
+)
+# A membership and the member's public profile; reads using it join the member's room.
+_PLAYER_COLUMNS = (
+    RoomPlayerModel.room_id,
+    RoomPlayerModel.created_at.label('joined_at'),
+    (RoomPlayerModel.user_id == RoomModel.room_owner_id).label('is_owner'),
+    *_USER_PUBLIC_COLUMNS,
+)
+
+
 class RoomService(SQLAlchemyAsyncRepositoryService[RoomModel]):
     repository_type = RoomRepository
 
     def _players_repo(self) -> RoomPlayerRepository:
         return RoomPlayerRepository(session=self.repository.session)
 
+    def _publish_changed(self, room_id: UUID) -> None:
+        event_bus.publish_on_commit(self.repository.session, RoomChanged(room_id=room_id))
+
     async def create_room(self, owner_id: UUID, data: dict[str, Any]) -> RoomModel:
         password = data.pop('password', None)
         hashed_password: str | None = None
@@ -63,38 +104,88 @@ class RoomService(SQLAlchemyAsyncRepositoryService[RoomModel]):
         )
 
         await self._players_repo().add(
-            RoomPlayerModel(room_id=room.id, user_id=owner_id, is_owner=True),
+            RoomPlayerModel(room_id=room.id, user_id=owner_id),
             auto_refresh=False,
         )
 
-        return await self.repository.get(room.id)
+        self._publish_changed(room.id)
+        return await self.get_room(room.id)
 
-    async def list_rooms(
+    async def list_room_summaries(
         self,
         category: str | None = None,
         q: str | None = None,
         status: str | None = None,
-    ) -> Sequence[RoomModel]:
-        filters = []
+        limit: int = 50,
+        after: RoomCursor | None = None,
+    ) -> tuple[Sequence[Row[Any]], RoomCursor | None]:
+        players_count = (
+            select(func.count(RoomPlayerModel.id))
+            .where(RoomPlayerModel.room_id == RoomModel.id)
+            .correlate(RoomModel)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                RoomModel.id,
+                RoomModel.name,
+                RoomModel.category,
+                RoomModel.room_owner_id,
+                func.coalesce(UserModel.name, UserModel.username).label('owner_name'),
+                players_count.label('players_count'),
+                RoomModel.players_limit,
+                RoomModel.turn_time,
+                RoomModel.status,
+                RoomModel.is_private,
+                RoomModel.has_password,
+                RoomModel.created_at,
+            )
+            .join(UserModel, UserModel.id == RoomModel.room_owner_id)
+            .order_by(RoomModel.created_at.desc(), RoomModel.id.desc())
+            .limit(limit + 1)
+        )
         if category:
-            filters.append(RoomModel.category == category)
+            stmt = stmt.where(RoomModel.category == category)
         if q:
-            filters.append(RoomModel.name.ilike(f'%{q}%'))
+            stmt = stmt.where(await self._name_filter(q))
         if status:
-            filters.append(RoomModel.status == status)
+            stmt = stmt.where(RoomModel.status == status)
+        if after is not None:
+            stmt = stmt.where(
+                and_(
+                    RoomModel.created_at <= after.created_at,
+                    or_(RoomModel.created_at < after.created_at, RoomModel.id < after.id),
+                )
+            )
 
-        rooms = await self.repository.list(
-            *filters,
-            order_by=[('created_at', True)],
-        )
-        return rooms
+        rows = (await self.repository.session.execute(stmt)).all()
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, RoomCursor(created_at=last.created_at, id=last.id)
+
+    async def _name_filter(self, q: str) -> ColumnElement[bool]:
+        # On Postgres the ILIKE is served by the pg_trgm GIN index ix_rooms_name_trgm.
+        if room_name_index is not None:
+            await room_name_index.refresh(self.repository.session)
+            room_ids = room_name_index.search(q)
+            if room_ids is not None:
+                return RoomModel.id.in_(room_ids)
+        return RoomModel.name.ilike(f'%{q}%')
 
     async def get_room(self, room_id: UUID) -> RoomModel:
         return await self.repository.get(room_id)
 
+    async def _get_owner_id(self, room_id: UUID) -> UUID:
+        owner_id = await self.repository.session.scalar(select(RoomModel.room_owner_id).where(RoomModel.id == room_id))
+        if owner_id is None:
+            raise NotFoundException(detail=ERR_ROOM_NOT_FOUND)
+        return owner_id
+
     async def update_room(self, room_id: UUID, actor_id: UUID, data: dict[str, Any]) -> RoomModel:
-        room = await self.get_room(room_id)
-        if room.room_owner_id != actor_id:
+        if await self._get_owner_id(room_id) != actor_id:
             raise PermissionDeniedException(ERR_ONLY_OWNER_UPDATE)
 
         patch: dict[str, Any] = {}
@@ -113,66 +204,158 @@ class RoomService(SQLAlchemyAsyncRepositoryService[RoomModel]):
                 patch[field] = data[field]
 
         if patch:
-            await super().update(item_id=room_id, data=patch, attribute_names=patch.keys())
+            await self.repository.session.execute(
+                update(RoomModel)
+                .where(RoomModel.id == room_id)
+                .values(**patch, updated_at=datetime.now(timezone.utc))
+                .execution_options(synchronize_session=False)
+            )
+            if 'name' in patch:
+                # Games show the room name, so cached copies of them are stale now.
+                await self.repository.session.execute(
+                    update(GameModel)
+                    .where(GameModel.room_id == room_id)
+                    .values(version=GameModel.version + 1)
+                    .execution_options(synchronize_session=False)
+                )
+            self._publish_changed(room_id)
 
         return await self.get_room(room_id)
 
     async def delete_room(self, room_id: UUID, actor_id: UUID) -> None:
-        room = await self.get_room(room_id)
-        if room.room_owner_id != actor_id:
+        if await self._get_owner_id(room_id) != actor_id:
             raise PermissionDeniedException(ERR_ONLY_OWNER_DELETE)
-        await self.repository.delete(room_id)
-
-    async def join_room(self, room_id: UUID, user_id: UUID, password: str | None = None) -> RoomModel:
-        room = await self.get_room(room_id)
-
-        players_repo = self._players_repo()
-
-        if await players_repo.exists(room_id=room_id, user_id=user_id):
-            return room
-
-        current_players = await players_repo.count(room_id=room_id)
-        if current_players >= room.players_limit:
-            raise NotAuthorizedException(detail=ERR_ROOM_FULL)
-
-        if room.has_password:
+        await self.repository.session.execute(delete(RoomModel).where(RoomModel.id == room_id))
+        self._publish_changed(room_id)
+
+    async def join_room(
+        self, room_id: UUID, user_id: UUID, password: str | None = None
+    ) -> tuple[RoomModel, list[Player]]:
+        """Adds the user to the room unless it is full; joining a room the user is already in is a no-op.
+
+        The password is checked from an unlocked read, so hashing never holds the room lock. The room row is then locked
+        and read together with its members, so two players racing for the last seat cannot both get it, and the
+        response is built from that read and the joiner's profile instead of reading the room again.
+        """
+        session = self.repository.session
+        is_member = exists().where(RoomPlayerModel.room_id == room_id, RoomPlayerModel.user_id == user_id)
+        joiner = (
+            await session.execute(
+                select(
+                    RoomModel.has_password,
+                    RoomModel.hashed_password,
+                    is_member.label('is_member'),
+                    *_USER_PUBLIC_COLUMNS,
+                )
+                .join(UserModel, UserModel.id == user_id)
+                .where(RoomModel.id == room_id)
+            )
+        ).one_or_none()
+        if joiner is None:
+            raise NotFoundException(detail=ERR_ROOM_NOT_FOUND)
+        if joiner.is_member:
+            return await self._get_room_with_players(room_id)
+        if joiner.has_password:
             if not password:
                 raise NotAuthorizedException(detail=ERR_PASSWORD_REQUIRED)
-            if not room.hashed_password or not await crypt.verify_password(password, room.hashed_password):
+            if not joiner.hashed_password or not await crypt.verify_password(password, joiner.hashed_password):
                 raise NotAuthorizedException(detail=ERR_INVALID_ROOM_PASSWORD)
 
-        await players_repo.add(RoomPlayerModel(room_id=room.id, user_id=user_id, is_owner=False))
-        return await self.get_room(room_id)
-
-    async def leave_room(self, room_id: UUID, user_id: UUID) -> None:
-        room = await self.get_room(room_id)
-        players_repo = self._players_repo()
+        room, players = await self._get_room_with_players(room_id, lock=True)
+        if any(player.user.id == user_id for player in players):
+            return room, players
+        if room.has_password and room.hashed_password != joiner.hashed_password:
+            # The password changed after it was checked.
+            raise NotAuthorizedException(detail=ERR_INVALID_ROOM_PASSWORD)
+        if len(players) >= room.players_limit:
+            raise NotAuthorizedException(detail=ERR_ROOM_FULL)
 
-        await players_repo.delete_where(room_id=room_id, user_id=user_id, sanity_check=False)
+        # Still guarded: backends without row locks (SQLite) let concurrent joins through the checks above.
+        now = datetime.now(timezone.utc)
+        members = select(func.count()).where(RoomPlayerModel.room_id == room_id).scalar_subquery()
+        seat = select(
+            literal(uuid4(), RoomPlayerModel.id.type),
+            literal(room_id, RoomPlayerModel.room_id.type),
+            literal(user_id, RoomPlayerModel.user_id.type),
+            literal(now, RoomPlayerModel.created_at.type),
+            literal(now, RoomPlayerModel.updated_at.type),
+        ).where(members < room.players_limit, ~is_member)
+        joined_at = await session.scalar(
+            insert(RoomPlayerModel)
+            .from_select(['id', 'room_id', 'user_id', 'created_at', 'updated_at'], seat)
+            .returning(RoomPlayerModel.created_at)
+        )
+        if joined_at is None:
+            if not await session.scalar(select(is_member)):
+                raise NotAuthorizedException(detail=ERR_ROOM_FULL)
+            return await self._get_room_with_players(room_id)
+
+        players.append(Player(user=UserPublic(*joiner[3:]), joined_at=joined_at, is_owner=False))
+        self._publish_changed(room_id)
+        return room, players
+
+    async def _get_room_with_players(self, room_id: UUID, lock: bool = False) -> tuple[RoomModel, list[Player]]:
+        """The room and its members in joining order, read in one query; ``lock`` locks the room row."""
+        stmt = (
+            select(RoomModel, *_PLAYER_COLUMNS)
+            .outerjoin(RoomPlayerModel, RoomPlayerModel.room_id == RoomModel.id)
+            .outerjoin(UserModel, UserModel.id == RoomPlayerModel.user_id)
+            .where(RoomModel.id == room_id)
+            .order_by(RoomPlayerModel.created_at, RoomPlayerModel.id)
+        )
+        if lock:
+            stmt = stmt.with_for_update(of=RoomModel)
+        rows = (await self.repository.session.execute(stmt)).all()
+        if not rows:
+            raise NotFoundException(detail=ERR_ROOM_NOT_FOUND)
+        players = self.to_player_schemas(tuple(row[1:]) for row in rows if row.room_id is not None)
+        return rows[0][0], players.get(room_id, [])
 
-        if room.room_owner_id == user_id:
-            remaining = await players_repo.list(
-                RoomPlayerModel.room_id == room_id,
-                order_by=[('created_at', False)],
-            )
-            if not remaining:
-                await self.repository.delete(room_id)
-                return
-            new_owner = remaining[0]
-            await players_repo.get_and_update(
-                RoomPlayerModel.id == new_owner.id,
-                attribute_names=('is_owner',),
-                is_owner=True,
-            )
-            await super().update(
-                item_id=room_id,
-                data={'room_owner_id': new_owner.user_id},
-                attribute_names=('room_owner_id',),
+    async def leave_room(self, room_id: UUID, user_id: UUID) -> None:
+        """Removes the user from the room; an owner leaving hands the room to the earliest remaining player, or deletes
+        it when nobody is left. The room row is locked first so concurrent joins and leaves apply one at a time.
+        """
+        session = self.repository.session
+        owner_id = await session.scalar(
+            select(RoomModel.room_owner_id).where(RoomModel.id == room_id).with_for_update(of=RoomModel)
+        )
+        if owner_id is None:
+            raise NotFoundException(detail=ERR_ROOM_NOT_FOUND)
+
+        left = await session.scalar(
+            delete(RoomPlayerModel)
+            .where(RoomPlayerModel.room_id == room_id, RoomPlayerModel.user_id == user_id)
+            .returning(RoomPlayerModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        if left is None:
+            return
+        self._publish_changed(room_id)
+        if owner_id != user_id:
+            return
+
+        successor = (
+            select(RoomPlayerModel.user_id)
+            .where(RoomPlayerModel.room_id == room_id)
+            .order_by(RoomPlayerModel.created_at)
+            .limit(1)
+            .scalar_subquery()
+        )
+        # Players read ownership off the room, so handing it over is this one guarded UPDATE.
+        new_owner_id = await session.scalar(
+            update(RoomModel)
+            .where(RoomModel.id == room_id, successor.is_not(None))
+            .values(room_owner_id=successor, updated_at=datetime.now(timezone.utc))
+            .returning(RoomModel.room_owner_id)
+            .execution_options(synchronize_session=False)
+        )
+        if new_owner_id is None:
+            await session.execute(
+                delete(RoomModel).where(RoomModel.id == room_id).execution_options(synchronize_session=False)
             )
 
     async def kick_player(self, room_id: UUID, actor_id: UUID, target_user_id: UUID) -> None:
-        room = await self.get_room(room_id)
-        if room.room_owner_id != actor_id:
+        if await self._get_owner_id(room_id) != actor_id:
             raise PermissionDeniedException(ERR_ONLY_OWNER_KICK)
         if target_user_id == actor_id:
             raise PermissionDeniedException(ERR_OWNER_CANNOT_KICK_SELF)
@@ -181,14 +364,47 @@ class RoomService(SQLAlchemyAsyncRepositoryService[RoomModel]):
         deleted = await players_repo.delete_where(room_id=room_id, user_id=target_user_id, sanity_check=False)
         if not deleted:
             raise NotFoundException(ERR_PLAYER_NOT_IN_ROOM)
+        self._publish_changed(room_id)
+
+    @staticmethod
+    def to_room_summary_schema(row: Row[Any]) -> RoomSummary:
+        return RoomSummary(
+            id=row.id,
+            name=row.name,
+            category=row.category,
+            room_owner=row.room_owner_id,
+            owner_name=row.owner_name,
+            players_count=row.players_count,
+            players_limit=row.players_limit,
+            turn_time=row.turn_time,
+            status=row.status,
+            is_private=row.is_private,
+            has_password=row.has_password,
+            created_at=row.created_at,
+        )
 
-    async def to_player_schema(self, link: RoomPlayerModel) -> Player:
-        user_service = UserService(session=self.repository.session)
-        user_public = user_service.to_schema(link.user, schema_type=UserPublic)
-        return Player(user=user_public, joined_at=link.created_at, is_owner=link.is_owner)
-
-    async def to_room_schema(self, room: RoomModel) -> Room:
-        players: Iterable[Player] = [await self.to_player_schema(p) for p in room.players]
+    async def players_by_room(self, room_ids: Collection[UUID]) -> dict[UUID, list[Player]]:
+        """Members of each room, in joining order, read in one query for a room or a whole page of them."""
+        rows = await self.repository.session.execute(
+            select(*_PLAYER_COLUMNS)
+            .join(RoomModel, RoomModel.id == RoomPlayerModel.room_id)
+            .join(UserModel, UserModel.id == RoomPlayerModel.user_id)
+            .where(RoomPlayerModel.room_id.in_(room_ids))
+            .order_by(RoomPlayerModel.created_at, RoomPlayerModel.id)
+        )
+        return self.to_player_schemas(rows.tuples())
+
+    @staticmethod
+    def to_player_schemas(rows: Iterable[tuple[Any, ...]]) -> dict[UUID, list[Player]]:
+        """Groups ``_PLAYER_COLUMNS`` rows into players by room, building the structs directly from the tuples."""
+        players: defaultdict[UUID, list[Player]] = defaultdict(list)
+        for room_id, joined_at, is_owner, *user in rows:
+            players[room_id].append(Player(user=UserPublic(*user), joined_at=joined_at, is_owner=is_owner))
+        return players
+
+    async def to_room_schema(self, room: RoomModel, players: list[Player] | None = None) -> Room:
+        if players is None:
+            players = (await self.players_by_room([room.id])).get(room.id, [])
         return Room(
             id=room.id,
             name=room.name,
@@ -198,7 +414,7 @@ class RoomService(SQLAlchemyAsyncRepositoryService[RoomModel]):
             turn_time=room.turn_time,
             is_private=room.is_private,
             has_password=room.has_password,
-            players=list(players),
+            players=players,
             status=room.status,
             created_at=room.created_at,
         )
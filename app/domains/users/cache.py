@@ -0,0 +1,13 @@
+from app.core.cache import TTLCache
+from app.core.events import event_bus
+from app.core.settings import settings
+from app.domains.users.events import UserChanged
+from app.domains.users.schemas import User
+
+user_cache: TTLCache[str, User] = TTLCache(
+    name='auth_users',
+    maxsize=settings.auth_user_cache_size,
+    ttl=settings.auth_user_cache_ttl,
+)
+
+event_bus.subscribe(UserChanged, lambda event: user_cache.invalidate(str(event.user_id)))
@@ -0,0 +1,14 @@
+from uuid import UUID
+
+from app.core.events import Event
+
+
+class UserChanged(Event, frozen=True):
+    user_id: UUID
+
+
+class UserRankChanged(Event, frozen=True):
+    user_id: UUID
+    username: str
+    points: int
+    avatar_url: str | None = None
@@ -1,4 +1,5 @@
 from advanced_alchemy.base import UUIDAuditBase
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -18,3 +19,6 @@ class UserModel(UUIDAuditBase):
 
     is_admin: Mapped[bool] = mapped_column(default=False, nullable=False)
     is_banned: Mapped[bool] = mapped_column(default=False, nullable=False)
+
+
+Index('ix_users_points_username', UserModel.points.desc(), UserModel.username)
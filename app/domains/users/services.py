@@ -5,6 +5,8 @@ from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService, schema_du
 from litestar.exceptions import NotAuthorizedException
 
 from app.core import crypt
+from app.core.events import event_bus
+from app.domains.users.events import UserChanged, UserRankChanged
 from app.domains.users.models import UserModel
 
 
@@ -17,12 +19,28 @@ class UserService(SQLAlchemyAsyncRepositoryService[UserModel]):
     async def create(self, data: Any) -> UserModel:  # type: ignore[override]
         dumped = schema_dump(data)
         dumped = await self._populate_with_hashed_password(dumped)
-        return await super().create(dumped)
+        created = await super().create(dumped)
+        self._publish_rank(created)
+        return created
 
     async def update(self, item_id: Any, data: Any) -> UserModel:  # type: ignore[override]
         dumped = schema_dump(data)
         dumped = await self._populate_with_hashed_password(dumped)
-        return await super().update(item_id=item_id, data=dumped)
+        updated = await super().update(item_id=item_id, data=dumped)
+        event_bus.publish_on_commit(self.repository.session, UserChanged(user_id=updated.id))
+        self._publish_rank(updated)
+        return updated
+
+    def _publish_rank(self, user: UserModel) -> None:
+        event_bus.publish_on_commit(
+            self.repository.session,
+            UserRankChanged(
+                user_id=user.id,
+                username=user.username,
+                points=user.points,
+                avatar_url=user.avatar_url,
+            ),
+        )
 
     async def _populate_with_hashed_password(self, data: dict[str, Any]) -> dict[str, Any]:
         if isinstance(data, dict) and 'password' in data:
@@ -0,0 +1,76 @@
+"""games guessed dictionary
+
+Revision ID: 4d7a1c93e5b0
+Revises: 9b4e71d2c8a3
+Create Date: 2026-10-18 22:41:09.517302
+
+"""
+
+import warnings
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from advanced_alchemy.types import (
+    GUID,
+    ORA_JSONB,
+    DateTimeUTC,
+    EncryptedString,
+    EncryptedText,
+    StoredObject,
+)
+from alembic import op
+from sqlalchemy import Text  # noqa: F401
+
+if TYPE_CHECKING:
+    pass
+
+__all__ = ['downgrade', 'upgrade', 'schema_upgrades', 'schema_downgrades', 'data_upgrades', 'data_downgrades']
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+sa.EncryptedString = EncryptedString
+sa.EncryptedText = EncryptedText
+sa.StoredObject = StoredObject
+
+# revision identifiers, used by Alembic.
+revision = '4d7a1c93e5b0'
+down_revision = '9b4e71d2c8a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning)
+        with op.get_context().autocommit_block():
+            schema_upgrades()
+            data_upgrades()
+
+
+def downgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning)
+        with op.get_context().autocommit_block():
+            data_downgrades()
+            schema_downgrades()
+
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('guessed_dictionary', sa.BigInteger(), nullable=True))
+
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_column('guessed_dictionary')
+
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
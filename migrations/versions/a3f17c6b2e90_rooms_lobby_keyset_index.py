@@ -0,0 +1,80 @@
+"""rooms lobby keyset index
+
+Revision ID: a3f17c6b2e90
+Revises: 5d0c8e2f9a41
+Create Date: 2026-10-18 11:47:05.629104
+
+"""
+
+import warnings
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from advanced_alchemy.types import (
+    GUID,
+    ORA_JSONB,
+    DateTimeUTC,
+    EncryptedString,
+    EncryptedText,
+    StoredObject,
+)
+from alembic import op
+from sqlalchemy import Text  # noqa: F401
+
+if TYPE_CHECKING:
+    pass
+
+__all__ = ['downgrade', 'upgrade', 'schema_upgrades', 'schema_downgrades', 'data_upgrades', 'data_downgrades']
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+sa.EncryptedString = EncryptedString
+sa.EncryptedText = EncryptedText
+sa.StoredObject = StoredObject
+
+# revision identifiers, used by Alembic.
+revision = 'a3f17c6b2e90'
+down_revision = '5d0c8e2f9a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning)
+        with op.get_context().autocommit_block():
+            schema_upgrades()
+            data_upgrades()
+
+
+def downgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning)
+        with op.get_context().autocommit_block():
+            data_downgrades()
+            schema_downgrades()
+
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+    op.create_index(
+        'ix_rooms_created_at_id',
+        'rooms',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_concurrently=True,
+    )
+
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+    op.drop_index('ix_rooms_created_at_id', table_name='rooms', postgresql_concurrently=True)
+
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
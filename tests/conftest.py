@@ -0,0 +1,117 @@
+import logging
+import os
+import tempfile
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+# Settings are read at import time, so the environment is set up before the app is imported.
+_workdir = tempfile.mkdtemp(prefix='wordcon-tests-')
+os.environ['DATABASE_URL'] = f'sqlite+aiosqlite:///{_workdir}/test.db'
+os.environ['DICTIONARIES_DIR'] = _workdir
+os.environ['EVENT_BUS_BACKEND'] = 'memory'
+os.environ['GAME_ENGINE_ENABLED'] = 'false'
+os.environ['GAME_SCHEDULER_ENABLED'] = 'false'
+
+from advanced_alchemy.base import metadata_registry  # noqa: E402
+from litestar.testing import AsyncTestClient  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+
+from app.app import app  # noqa: E402
+from app.core.database import sqlalchemy_config  # noqa: E402
+
+metadata = metadata_registry.get(None)
+
+
+class QueryCounter:
+    """Statements sent to the database while ``count()`` is active."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] | None = None
+
+    def _record(self, conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+        if self.statements is not None:
+            self.statements.append(statement)
+
+    @contextmanager
+    def count(self) -> Iterator[list[str]]:
+        self.statements = []
+        try:
+            yield self.statements
+        finally:
+            self.statements = None
+
+
+@pytest.fixture(scope='session')
+def anyio_backend() -> str:
+    return 'asyncio'
+
+
+@pytest.fixture(scope='session')
+def database() -> Iterator[Any]:
+    # A synchronous engine on the same file, so schema work never touches the app's event loop.
+    engine = create_engine(f'sqlite:///{_workdir}/test.db')
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope='session')
+async def client(database: Any) -> AsyncIterator[AsyncTestClient[Any]]:
+    # The app keeps module-level workers and locks bound to the loop it starts on, so it is started once.
+    async with AsyncTestClient(app=app) as test_client:
+        yield test_client
+    # Access logs are buffered; flush them while pytest still captures the stream they were configured with.
+    logging.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def clean_database(database: Any) -> None:
+    with database.begin() as conn:
+        for table in reversed(metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture
+def queries() -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+    engine = sqlalchemy_config.get_engine().sync_engine
+    event.listen(engine, 'before_cursor_execute', counter._record)
+    yield counter
+    event.remove(engine, 'before_cursor_execute', counter._record)
+
+
+Client = AsyncTestClient[Any]
+
+
+async def signup(client: Client, username: str) -> dict[str, str]:
+    response = await client.post(
+        '/users/signup',
+        json={'email': f'{username}@example.com', 'password': 'password1', 'username': username},
+    )
+    assert response.status_code == 201, response.text
+    headers = {'Authorization': response.headers['authorization']}
+    # Warms the auth user cache, so query counts leave out the lookup of the caller.
+    assert (await client.get('/users/me', headers=headers)).status_code == 200
+    return headers
+
+
+async def create_room(client: Client, owner: dict[str, str], players_limit: int = 3, name: str = 'Room') -> str:
+    response = await client.post(
+        '/rooms',
+        json={'name': name, 'playersLimit': players_limit, 'turnTime': 60, 'category': 'Animals'},
+        headers=owner,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()['id']
+
+
+async def start_game(client: Client) -> tuple[dict[str, str], dict[str, str], str]:
+    owner, guest = await signup(client, 'owner'), await signup(client, 'guest')
+    room_id = await create_room(client, owner)
+    assert (await client.post(f'/rooms/{room_id}/join', headers=guest)).status_code == 201
+    response = await client.post(f'/rooms/{room_id}/start', headers=owner)
+    assert response.status_code == 201, response.text
+    return owner, guest, response.json()['id']
@@ -0,0 +1,124 @@
+"""Request coalescing, response caching and the shared HTTP helpers."""
+
+import asyncio
+
+import pytest
+from litestar import Response
+from litestar.exceptions import ValidationException
+
+from app.core.etag import etag_matches, weak_etag
+from app.core.pagination import Cursor
+from app.core.singleflight import SingleFlight
+from tests.conftest import Client, signup
+
+pytestmark = pytest.mark.anyio
+
+
+class PageCursor(Cursor):
+    score: int
+    name: str
+
+
+def test_cursor_round_trip() -> None:
+    cursor = PageCursor(score=10, name='a/b+c')
+    raw = cursor.encode()
+    assert '=' not in raw
+    assert PageCursor.decode(raw) == cursor
+
+
+@pytest.mark.parametrize('raw', ['not base64!', 'e30', 'WzEsMl0'])
+def test_cursor_rejects_garbage(raw: str) -> None:
+    with pytest.raises(ValidationException):
+        PageCursor.decode(raw)
+
+
+def test_etag_matches_weakly() -> None:
+    assert etag_matches('W/"3"', weak_etag(3))
+    assert etag_matches('"3"', weak_etag(3))
+    assert etag_matches('W/"1", W/"3"', weak_etag(3))
+    assert etag_matches('*', weak_etag(3))
+    assert not etag_matches('W/"2"', weak_etag(3))
+
+
+async def test_single_flight_shares_one_read() -> None:
+    flights = SingleFlight('test')
+    release = asyncio.Event()
+    reads = 0
+
+    async def read() -> dict[str, int]:
+        nonlocal reads
+        reads += 1
+        await release.wait()
+        return {'reads': reads}
+
+    callers = [asyncio.create_task(flights.do('key', read)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert len(flights) == 1
+    release.set()
+    landed = await asyncio.gather(*callers)
+
+    assert reads == 1
+    assert {result.body for result in landed} == {b'{"reads":1}'}
+    assert len(flights) == 0
+    # Nothing is kept once the flight lands.
+    assert (await flights.do('key', read)).body == b'{"reads":2}'
+
+
+async def test_single_flight_shares_failures_and_response_metadata() -> None:
+    flights = SingleFlight('test')
+
+    async def fail() -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError('boom')
+
+    results = await asyncio.gather(*(flights.do('key', fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def not_modified() -> Response[None]:
+        return Response(None, status_code=304, headers={'ETag': 'W/"1"'})
+
+    landed = await flights.do('key', not_modified)
+    assert (landed.status_code, landed.headers, landed.body) == (304, {'ETag': 'W/"1"'}, b'')
+
+
+async def test_single_flight_forget_starts_a_new_read() -> None:
+    flights = SingleFlight('test')
+    release = asyncio.Event()
+    reads = 0
+
+    async def read() -> int:
+        nonlocal reads
+        reads += 1
+        seen = reads
+        await release.wait()
+        return seen
+
+    first = asyncio.create_task(flights.do(('game', 1, None), read))
+    await asyncio.sleep(0)
+    flights.forget_resource('game')
+    second = asyncio.create_task(flights.do(('game', 1, None), read))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert ((await first).body, (await second).body) == (b'1', b'2')
+
+
+async def test_response_cache_answers_conditional_gets(client: Client) -> None:
+    user = await signup(client, 'reader')
+    response = await client.get('/categories', headers=user)
+    assert response.status_code == 200
+    etag = response.headers['etag']
+    assert 'max-age' in response.headers['cache-control']
+    assert 'Animals' in [category['name'] for category in response.json()]
+
+    cached = await client.get('/categories', headers=user)
+    assert cached.headers['etag'] == etag
+    assert cached.content == response.content
+
+    not_modified = await client.get('/categories', headers={**user, 'If-None-Match': etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b''
+    assert not_modified.headers['etag'] == etag
+
+    changed = await client.get('/categories', headers={**user, 'If-None-Match': '"stale"'})
+    assert changed.status_code == 200
@@ -0,0 +1,76 @@
+"""Compiled category dictionaries: exact and typo-tolerant lookups, and the guessed-words bitset over their ordinals."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from app.domains.dictionaries.engine import CategoryDictionary, compile_dictionary
+from app.domains.games import guessed
+
+WORDS = ['cat', 'Camel', 'cheetah', 'chicken', 'ёж', 'kitten', 'mitten', 'sitting', 'cat']
+
+
+@pytest.fixture
+def dictionary(tmp_path: Path) -> Iterator[CategoryDictionary]:
+    path = tmp_path / 'animals.wcd'
+    assert compile_dictionary('Animals', WORDS, path, max_distance=2) == 8
+    compiled = CategoryDictionary(path)
+    yield compiled
+    compiled.close()
+
+
+def test_exact_lookups_are_normalized(dictionary: CategoryDictionary) -> None:
+    assert dictionary.name == 'Animals'
+    assert len(dictionary) == 8
+    assert list(dictionary) == sorted(dictionary, key=str.encode)
+    assert 'CAMEL' in dictionary
+    assert '  Cat ' in dictionary
+    assert 'еж' in dictionary
+    assert 'dog' not in dictionary
+    assert dictionary.word(dictionary.index('cheetah')) == 'cheetah'  # type: ignore[arg-type]
+
+
+def test_typos_match_the_closest_word(dictionary: CategoryDictionary) -> None:
+    assert dictionary.match('cheeta', 1) == dictionary.index('cheetah')
+    assert dictionary.match('chikcen', 2) == dictionary.index('chicken')
+    assert dictionary.match('chikcen', 1) is None
+    assert dictionary.match('sittin', 0) is None
+    # The query is as close to kitten as to mitten; the lower ordinal wins.
+    assert dictionary.match('bitten', 1) == dictionary.index('kitten')
+    # Capped at the distance the dictionary was compiled for.
+    assert dictionary.match('chickenxyz', 3) is None
+
+
+def test_fingerprint_follows_the_word_list(tmp_path: Path, dictionary: CategoryDictionary) -> None:
+    same = tmp_path / 'same.wcd'
+    compile_dictionary('Animals', reversed(WORDS), same, max_distance=2)
+    grown = tmp_path / 'grown.wcd'
+    compile_dictionary('Animals', [*WORDS, 'bee'], grown, max_distance=2)
+
+    for path, equal in ((same, True), (grown, False)):
+        other = CategoryDictionary(path)
+        try:
+            assert (other.fingerprint == dictionary.fingerprint) is equal
+        finally:
+            other.close()
+
+
+def test_guessed_bitset_rejects_duplicates() -> None:
+    bits = bytearray()
+    assert not guessed.contains(bits, 13)
+    guessed.add(bits, 13)
+    guessed.add(bits, 0)
+    assert len(bits) == 2
+    assert guessed.contains(bits, 13)
+    assert guessed.contains(bits, 0)
+    assert not guessed.contains(bits, 12)
+    assert not guessed.contains(bits, 800)
+    assert not guessed.contains(None, 0)
+
+
+def test_guessed_bitset_is_dropped_for_another_compile() -> None:
+    assert guessed.load(b'\x01', 7, 7) == bytearray(b'\x01')
+    assert guessed.load(b'\x01', 7, 8) == bytearray()
+    assert guessed.load(b'\x01', None, 8) == bytearray()
+    assert guessed.load(None, 7, 7) == bytearray()
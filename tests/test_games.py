@@ -0,0 +1,183 @@
+"""Guessing, standings, deltas and completion of games on the SQL path, and the round scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from litestar.exceptions import ValidationException
+
+from app.domains.games.constants import ERR_WORD_ALREADY_GUESSED
+from app.domains.games.batching import GuessBatcher, PendingGuess
+from app.domains.games.completion import rank_places
+from app.domains.games.history import GameHistory
+from app.domains.games.scheduler import RoundScheduler
+from app.domains.games.standings import Standings
+from tests.conftest import Client, start_game
+
+pytestmark = pytest.mark.anyio
+
+
+async def guess(client: Client, player: dict[str, str], game_id: str, text: str) -> Any:
+    return await client.post(f'/games/{game_id}/guess', json={'text': text}, headers=player)
+
+
+async def test_words_score_once_per_game(client: Client) -> None:
+    owner, guest, game_id = await start_game(client)
+
+    assert (await guess(client, guest, game_id, 'cheetah')).status_code == 201
+    for player, text in ((guest, 'cheetah'), (owner, 'CHEETAH'), (owner, 'cheeta')):
+        response = await guess(client, player, game_id, text)
+        assert response.status_code == 400
+        assert response.json()['detail'] == ERR_WORD_ALREADY_GUESSED
+
+    unknown = await guess(client, owner, game_id, 'spaceship')
+    assert unknown.status_code == 400
+    assert unknown.json()['detail'] != ERR_WORD_ALREADY_GUESSED
+
+    game = (await client.get(f'/games/{game_id}', headers=owner)).json()
+    assert sorted(point['value'] for point in game['points']) == [0, 1]
+
+
+async def test_finishing_ranks_players_and_credits_their_points(client: Client) -> None:
+    owner, guest, game_id = await start_game(client)
+    for text in ('cat', 'camel'):
+        assert (await guess(client, guest, game_id, text)).status_code == 201
+    assert (await guess(client, owner, game_id, 'bison')).status_code == 201
+
+    response = await client.post(f'/games/{game_id}/finish', headers=owner)
+    assert response.status_code == 201
+    game = response.json()
+    assert game['state'] == 'ended'
+    assert game['endDate'] is not None
+
+    guest_id = (await client.get('/users/me', headers=guest)).json()['id']
+    places = {place['userId']: place['place'] for place in game['places']}
+    assert places[guest_id] == 1
+    assert sorted(places.values()) == [1, 2]
+
+    assert (await client.get('/users/me', headers=guest)).json()['points'] == 2
+    assert (await client.get('/users/me', headers=owner)).json()['points'] == 1
+    # Guesses after the end neither score nor fail.
+    assert (await guess(client, guest, game_id, 'bear')).status_code == 201
+    assert (await client.get('/users/me', headers=guest)).json()['points'] == 2
+
+
+def test_equal_points_share_a_place() -> None:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    scores = [('late', 3, start + timedelta(seconds=2)), ('top', 5, start), ('early', 3, start), ('last', 0, start)]
+    assert rank_places(scores) == [('top', 1), ('early', 2), ('late', 2), ('last', 4)]
+
+
+def test_standings_follow_point_changes() -> None:
+    users = [uuid4() for _ in range(3)]
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    standings = Standings(users, [0, 0, 0], [now + timedelta(seconds=slot) for slot in range(3)], [None] * 3)
+
+    standings.add(2, 2)
+    standings.add(1, 2)
+    assert [place.user_id for place in standings.game_places()] == [users[1], users[2], users[0]]
+    assert [place.place for place in standings.game_places()] == [1, 1, 3]
+    assert {point.user_id: point.value for point in standings.game_points()} == dict(zip(users, [0, 2, 2], strict=True))
+
+
+def test_history_returns_only_what_changed() -> None:
+    users = [uuid4() for _ in range(3)]
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    standings = Standings(users, [0, 0, 0], [now] * 3, [None] * 3)
+    history = GameHistory(depth=2, max_games=10)
+    game_id = uuid4()
+
+    history.record(game_id, 1, standings)
+    standings.add(0, 1)
+    history.record(game_id, 2, standings)
+    standings.add(2, 1)
+    history.record(game_id, 3, standings)
+
+    assert history.changes_since(game_id, 3, 3) == ([], [])
+    points, places = history.changes_since(game_id, 2, 3)  # type: ignore[misc]
+    assert [(point.user_id, point.value) for point in points] == [(users[2], 1)]
+    assert {place.user_id for place in places} == {users[1], users[2]}
+    points, _ = history.changes_since(game_id, 1, 3)  # type: ignore[misc]
+    assert {point.user_id for point in points} == {users[0], users[2]}
+
+    standings.add(1, 5)
+    history.record(game_id, 4, standings)
+    # Older than the last ``depth`` changes, or not the version being served.
+    assert history.changes_since(game_id, 1, 4) is None
+    assert history.changes_since(game_id, 2, 3) is None
+    assert history.changes_since(uuid4(), 1, 1) is None
+
+
+async def test_game_reads_since_a_version_get_a_delta(client: Client) -> None:
+    owner, guest, game_id = await start_game(client)
+    base = (await client.get(f'/games/{game_id}', headers=owner)).json()
+    assert (await guess(client, guest, game_id, 'cat')).status_code == 201
+
+    response = await client.get(f'/games/{game_id}', params={'since': base['version']}, headers=owner)
+    delta = response.json()
+    assert response.headers['etag'] == f'W/"{delta["version"]}"'
+    assert delta['since'] == base['version']
+    assert delta['version'] > base['version']
+    assert [point['value'] for point in delta['points']] == [1]
+
+    unknown = (await client.get(f'/games/{game_id}', params={'since': 0}, headers=owner)).json()
+    assert 'since' not in unknown
+    assert len(unknown['points']) == 2
+
+
+async def test_batcher_applies_concurrent_guesses_together() -> None:
+    batches: list[list[str]] = []
+
+    async def apply(game_id: UUID, guesses: list[PendingGuess]) -> list[Any]:
+        batches.append([g.text for g in guesses])
+        return [ValidationException(detail='dup') if g.text == 'dup' else g.text.upper() for g in guesses]
+
+    batcher = GuessBatcher(window=0.01, max_size=3)
+    batcher.start(apply)
+    game_id, user_id = uuid4(), uuid4()
+    results = await asyncio.gather(
+        *(batcher.submit(game_id, user_id, text) for text in ('a', 'dup', 'b', 'c', 'd')),
+        batcher.submit(uuid4(), user_id, 'other'),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], ValidationException)
+    assert [results[0], *results[2:]] == ['A', 'B', 'C', 'D', 'OTHER']
+    assert sorted(batches) == [['a', 'dup', 'b'], ['c', 'd'], ['other']]
+    await batcher.stop()
+
+
+async def test_batcher_fails_every_guess_of_a_failed_batch() -> None:
+    async def apply(game_id: UUID, guesses: list[PendingGuess]) -> list[Any]:
+        raise RuntimeError('database is gone')
+
+    batcher = GuessBatcher(window=0, max_size=10)
+    batcher.start(apply)
+    game_id = uuid4()
+    results = await asyncio.gather(*(batcher.submit(game_id, uuid4(), 'cat') for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_scheduler_advances_expired_rounds_and_ends_the_last(client: Client) -> None:
+    owner, _, game_id = await start_game(client)
+    scheduler = RoundScheduler(resync_interval=60, batch_size=10, max_rounds=2)
+    game = (await client.get(f'/games/{game_id}', headers=owner)).json()
+    last_tick_at = datetime.fromisoformat(game['lastTickAt'])
+
+    # Not due yet: nothing happens.
+    scheduler.schedule(UUID(game_id), last_tick_at, game['turnTime'])
+    await scheduler._advance_due()
+    assert (await client.get(f'/games/{game_id}', headers=owner)).json()['round'] == 1
+
+    # Rescheduled as if the turn had run out.
+    scheduler.schedule(UUID(game_id), last_tick_at, 0)
+    await scheduler._advance_due()
+    game = (await client.get(f'/games/{game_id}', headers=owner)).json()
+    assert (game['round'], game['state']) == (2, 'running')
+
+    scheduler.schedule(UUID(game_id), datetime.fromisoformat(game['lastTickAt']), 0)
+    await scheduler._advance_due()
+    game = (await client.get(f'/games/{game_id}', headers=owner)).json()
+    assert (game['round'], game['state']) == (2, 'ended')
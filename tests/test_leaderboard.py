@@ -0,0 +1,84 @@
+"""Leaderboard ordering: the in-memory rank index and the keyset-paginated list."""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from app.domains.leaderboard.engine import LeaderboardEngine, RankedUser
+from tests.conftest import Client, signup
+
+pytestmark = pytest.mark.anyio
+
+
+def ranked(username: str, points: int) -> RankedUser:
+    return RankedUser(user_id=uuid4(), username=username, points=points, avatar_url=None)
+
+
+def test_engine_ranks_by_points_then_username() -> None:
+    engine = LeaderboardEngine()
+    ann, bob, cid, dan = ranked('ann', 5), ranked('bob', 9), ranked('cid', 5), ranked('dan', 1)
+    engine.load([ann, bob, cid, dan])
+
+    assert [engine.rank(user.user_id) for user in (bob, ann, cid, dan)] == [(1, bob), (2, ann), (3, cid), (4, dan)]
+    assert engine.rank(uuid4()) is None
+
+
+def test_engine_moves_users_as_points_change() -> None:
+    engine = LeaderboardEngine()
+    ann, bob, cid = ranked('ann', 5), ranked('bob', 9), ranked('cid', 1)
+    engine.load([ann, bob, cid])
+
+    cid = cid._replace(points=10)
+    engine.upsert(cid)
+    assert engine.rank(cid.user_id) == (1, cid)
+    assert engine.rank(bob.user_id) == (2, bob)
+    assert len(engine) == 3
+
+    engine.remove(bob.user_id)
+    assert engine.rank(bob.user_id) is None
+    assert engine.rank(ann.user_id) == (2, ann)
+
+    newcomer = ranked('eve', 0)
+    engine.upsert(newcomer)
+    assert engine.rank(newcomer.user_id) == (3, newcomer)
+
+
+def test_engine_neighbourhood_is_clipped_at_both_ends() -> None:
+    engine = LeaderboardEngine()
+    users = [ranked(f'user{idx}', 100 - idx) for idx in range(6)]
+    engine.load(users)
+
+    assert [place for place, _ in engine.around(users[0].user_id, radius=2)] == [1, 2, 3]
+    assert [place for place, _ in engine.around(users[3].user_id, radius=1)] == [3, 4, 5]
+    assert [user for _, user in engine.around(users[5].user_id, radius=2)] == users[3:]
+    assert engine.around(uuid4(), radius=2) == []
+
+
+async def test_leaderboard_pages_follow_the_cursor(client: Client) -> None:
+    users = [await signup(client, username) for username in ('erin', 'carl', 'anna', 'dora', 'bert')]
+
+    entries: list[dict[str, Any]] = []
+    cursor: str | None = None
+    pages = 0
+    while True:
+        params: dict[str, str | int] = {'limit': 2}
+        if cursor is not None:
+            params['cursor'] = cursor
+        response = await client.get('/leaderboard', params=params, headers=users[0])
+        assert response.status_code == 200
+        entries.extend(response.json())
+        pages += 1
+        cursor = response.headers.get('x-next-cursor')
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert [entry['username'] for entry in entries] == ['anna', 'bert', 'carl', 'dora', 'erin']
+    assert [entry['place'] for entry in entries] == [1, 2, 3, 4, 5]
+
+
+async def test_leaderboard_rejects_a_bad_cursor(client: Client) -> None:
+    user = await signup(client, 'reader')
+    response = await client.get('/leaderboard', params={'cursor': 'garbage'}, headers=user)
+    assert response.status_code == 400
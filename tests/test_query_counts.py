@@ -0,0 +1,143 @@
+"""Database round trips per request on the SQL path; a change here is a change in how the endpoint reads or writes."""
+
+import pytest
+
+from tests.conftest import Client, QueryCounter, create_room, signup, start_game
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_get_room(client: Client, queries: QueryCounter) -> None:
+    owner = await signup(client, 'owner')
+    room_id = await create_room(client, owner)
+
+    with queries.count() as statements:
+        response = await client.get(f'/rooms/{room_id}', headers=owner)
+    assert response.status_code == 200
+    # The room row, its players.
+    assert len(statements) == 2
+
+
+async def test_update_room(client: Client, queries: QueryCounter) -> None:
+    owner = await signup(client, 'owner')
+    room_id = await create_room(client, owner)
+
+    with queries.count() as statements:
+        response = await client.patch(f'/rooms/{room_id}', json={'name': 'Renamed'}, headers=owner)
+    assert response.status_code == 200
+    assert response.json()['name'] == 'Renamed'
+    # Owner id, the room UPDATE, the games version bump for the new name, the room row, its players.
+    assert len(statements) == 5
+
+
+async def test_join_room(client: Client, queries: QueryCounter) -> None:
+    owner, guest = await signup(client, 'owner'), await signup(client, 'guest')
+    room_id = await create_room(client, owner)
+
+    with queries.count() as statements:
+        response = await client.post(f'/rooms/{room_id}/join', headers=guest)
+    assert response.status_code == 201
+    assert [player['user']['username'] for player in response.json()['players']] == ['owner', 'guest']
+    # Password and profile read, locked room with its members, the INSERT.
+    assert len(statements) == 3
+
+    with queries.count() as statements:
+        response = await client.post(f'/rooms/{room_id}/join', headers=guest)
+    assert response.status_code == 201
+    assert len(response.json()['players']) == 2
+    # Already a member: the first read, then the room with its members.
+    assert len(statements) == 2
+
+
+async def test_leave_room(client: Client, queries: QueryCounter) -> None:
+    owner, guest = await signup(client, 'owner'), await signup(client, 'guest')
+    room_id = await create_room(client, owner)
+    assert (await client.post(f'/rooms/{room_id}/join', headers=guest)).status_code == 201
+
+    with queries.count() as statements:
+        response = await client.post(f'/rooms/{room_id}/leave', headers=guest)
+    assert response.status_code == 204
+    # Locked owner id, the DELETE.
+    assert len(statements) == 2
+
+    with queries.count() as statements:
+        response = await client.post(f'/rooms/{room_id}/leave', headers=guest)
+    assert response.status_code == 204
+    # Not a member any more: the DELETE matches nothing and the room is left as is.
+    assert len(statements) == 2
+
+
+async def test_owner_leaves_room(client: Client, queries: QueryCounter) -> None:
+    owner, guest = await signup(client, 'owner'), await signup(client, 'guest')
+    room_id = await create_room(client, owner)
+    assert (await client.post(f'/rooms/{room_id}/join', headers=guest)).status_code == 201
+
+    with queries.count() as statements:
+        response = await client.post(f'/rooms/{room_id}/leave', headers=owner)
+    assert response.status_code == 204
+    # Locked owner id, the DELETE, the handoff UPDATE.
+    assert len(statements) == 3
+
+    players = (await client.get(f'/rooms/{room_id}', headers=guest)).json()['players']
+    assert [(player['user']['username'], player['isOwner']) for player in players] == [('guest', True)]
+
+
+async def test_start_game(client: Client, queries: QueryCounter) -> None:
+    owner, guest = await signup(client, 'owner'), await signup(client, 'guest')
+    room_id = await create_room(client, owner)
+    assert (await client.post(f'/rooms/{room_id}/join', headers=guest)).status_code == 201
+
+    with queries.count() as statements:
+        response = await client.post(f'/rooms/{room_id}/start', headers=owner)
+    assert response.status_code == 201
+    assert len(response.json()['points']) == 2
+    # Room status UPDATE, game INSERT, players INSERT ... SELECT, the snapshot.
+    assert len(statements) == 4
+
+
+async def test_get_game(client: Client, queries: QueryCounter) -> None:
+    owner, _, game_id = await start_game(client)
+
+    with queries.count() as statements:
+        response = await client.get(f'/games/{game_id}', headers=owner)
+    assert response.status_code == 200
+    # The snapshot only: the read key is built without the database.
+    assert len(statements) == 1
+
+    with queries.count() as statements:
+        response = await client.get(f'/games/{game_id}', headers={**owner, 'If-None-Match': response.headers['etag']})
+    assert response.status_code == 304
+    # The version, read once for the ETag comparison.
+    assert len(statements) == 1
+
+
+async def test_guess(client: Client, queries: QueryCounter) -> None:
+    _, guest, game_id = await start_game(client)
+
+    with queries.count() as statements:
+        response = await client.post(f'/games/{game_id}/guess', json={'text': 'cat'}, headers=guest)
+    assert response.status_code == 201
+    # Game head, players of the batch, points UPDATE, game UPDATE, the snapshot.
+    assert len(statements) == 5
+
+
+async def test_tick(client: Client, queries: QueryCounter) -> None:
+    owner, _, game_id = await start_game(client)
+
+    with queries.count() as statements:
+        response = await client.post(f'/games/{game_id}/tick', headers=owner)
+    assert response.status_code == 201
+    # Game with its room's owner, the guarded UPDATE, the snapshot.
+    assert len(statements) == 3
+
+
+async def test_finish_game(client: Client, queries: QueryCounter) -> None:
+    owner, guest, game_id = await start_game(client)
+    assert (await client.post(f'/games/{game_id}/guess', json={'text': 'cat'}, headers=guest)).status_code == 201
+
+    with queries.count() as statements:
+        response = await client.post(f'/games/{game_id}/finish', headers=owner)
+    assert response.status_code == 201
+    assert response.json()['state'] == 'ended'
+    # Owner id, game UPDATE, players, places UPDATE, user points UPDATE, rooms UPDATE, scored users, the snapshot.
+    assert len(statements) == 8
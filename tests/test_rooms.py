@@ -0,0 +1,49 @@
+"""Lobby pagination and room name search."""
+
+import pytest
+
+from tests.conftest import Client, create_room, signup
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_lobby_pages_follow_the_cursor(client: Client) -> None:
+    owner = await signup(client, 'owner')
+    created = [await create_room(client, owner, name=f'Room {idx}') for idx in range(5)]
+
+    seen: list[str] = []
+    cursor: str | None = None
+    while True:
+        params: dict[str, str | int] = {'limit': 2}
+        if cursor is not None:
+            params['cursor'] = cursor
+        response = await client.get('/rooms', params=params, headers=owner)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(room['id'] for room in page)
+        cursor = response.headers.get('x-next-cursor')
+        if cursor is None:
+            break
+
+    # Newest first, each room exactly once.
+    assert seen == created[::-1]
+
+
+async def test_lobby_rejects_a_bad_cursor(client: Client) -> None:
+    owner = await signup(client, 'owner')
+    response = await client.get('/rooms', params={'cursor': 'garbage'}, headers=owner)
+    assert response.status_code == 400
+
+
+async def test_lobby_search_sees_renamed_rooms(client: Client) -> None:
+    owner = await signup(client, 'owner')
+    zoo = await create_room(client, owner, name='Zoo Keepers')
+    await create_room(client, owner, name='Kitchen')
+
+    response = await client.get('/rooms', params={'q': 'keeper'}, headers=owner)
+    assert [room['id'] for room in response.json()] == [zoo]
+
+    assert (await client.patch(f'/rooms/{zoo}', json={'name': 'Aquarium'}, headers=owner)).status_code == 200
+    assert (await client.get('/rooms', params={'q': 'keeper'}, headers=owner)).json() == []
+    assert [room['id'] for room in (await client.get('/rooms', params={'q': 'quar'}, headers=owner)).json()] == [zoo]